@@ -1,5 +1,6 @@
 # api/client.py
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 
@@ -8,55 +9,72 @@ class GuardianSensorClient:
     
     def __init__(self, base_url="http://localhost:8000"):
         self.base_url = base_url
+        
+        # Reuse one session so keep-alive connections are pooled across calls
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
     
     def send_sensor_data(self, data):
         """Send sensor data to API"""
         url = f"{self.base_url}/sensors"
-        response = requests.post(url, json=data)
+        response = self.session.post(url, json=data)
         return response.json()
     
     def get_risk_assessment(self):
         """Get current risk assessment"""
         url = f"{self.base_url}/risk"
-        response = requests.get(url)
+        response = self.session.get(url)
         return response.json()
     
-    def get_dashboard_data(self):
-        """Get dashboard data"""
+    def get_dashboard_data(self, history="records"):
+        """Get dashboard data (history="columns" returns the sensor history column-wise)"""
         url = f"{self.base_url}/dashboard"
-        response = requests.get(url)
+        params = {"history": history} if history != "records" else {}
+        response = self.session.get(url, params=params)
         return response.json()
     
     def get_alerts(self, status=None):
         """Get alerts"""
         url = f"{self.base_url}/alerts"
         params = {"status": status} if status else {}
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         return response.json()
+    
+    def close(self):
+        """Close the underlying HTTP session"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 # Test the API
 if __name__ == "__main__":
-    client = GuardianSensorClient()
-    
-    # Test data
-    test_data = {
-        "temperature_c": 38.5,
-        "weight_left_kg": 15.2,
-        "weight_right_kg": 0.0,
-        "motion_detected": False,
-        "door_state": "closed",
-        "engine_state": "off",
-        "timestamp": datetime.now().isoformat()
-    }
-    
-    print("Sending sensor data...")
-    result = client.send_sensor_data(test_data)
-    print("Response:", json.dumps(result, indent=2))
-    
-    print("\nGetting risk assessment...")
-    risk = client.get_risk_assessment()
-    print("Risk:", json.dumps(risk, indent=2))
-    
-    print("\nGetting dashboard data...")
-    dashboard = client.get_dashboard_data()
-    print("Dashboard metrics:", json.dumps(dashboard["metrics"], indent=2))
\ No newline at end of file
+    with GuardianSensorClient() as client:
+        # Test data
+        test_data = {
+            "temperature_c": 38.5,
+            "weight_left_kg": 15.2,
+            "weight_right_kg": 0.0,
+            "motion_detected": False,
+            "door_state": "closed",
+            "engine_state": "off",
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        print("Sending sensor data...")
+        result = client.send_sensor_data(test_data)
+        print("Response:", json.dumps(result, indent=2))
+        
+        print("\nGetting risk assessment...")
+        risk = client.get_risk_assessment()
+        print("Risk:", json.dumps(risk, indent=2))
+        
+        print("\nGetting dashboard data...")
+        dashboard = client.get_dashboard_data()
+        print("Dashboard metrics:", json.dumps(dashboard["metrics"], indent=2))
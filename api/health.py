@@ -2,34 +2,48 @@ from fastapi import APIRouter, HTTPException
 from datetime import datetime
 import psutil
 import os
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter(tags=["health"])
 
+# Values that don't change for the lifetime of the process
+_BOOT_TIME = psutil.boot_time()
+_ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
+
+# Prime psutil so later non-blocking cpu_percent() calls have a baseline
+psutil.cpu_percent(interval=None)
+
+# Data directory existence is re-checked at most this often
+DIRECTORY_CHECK_INTERVAL = 30.0  # seconds
+DATA_DIRS = [
+    'data/raw/mmwave',
+    'data/processed', 
+    'outputs/visualizations'
+]
+_directory_cache = {"checked_at": float("-inf"), "status": {}}
+
+def _directory_status():
+    """Return cached existence of each data directory"""
+    now = time.monotonic()
+    if now - _directory_cache["checked_at"] >= DIRECTORY_CHECK_INTERVAL:
+        _directory_cache["status"] = {d: os.path.exists(d) for d in DATA_DIRS}
+        _directory_cache["checked_at"] = now
+    return _directory_cache["status"]
+
 @router.get("/health")
 async def health_check():
     """Comprehensive health check endpoint for CI/CD and monitoring"""
     try:
         # Basic system checks
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
         
         # Application-specific checks
-        data_dirs = [
-            'data/raw/mmwave',
-            'data/processed', 
-            'outputs/visualizations'
-        ]
-        
-        directory_status = {}
-        missing_dirs = []
-        for dir_path in data_dirs:
-            exists = os.path.exists(dir_path)
-            directory_status[dir_path] = exists
-            if not exists:
-                missing_dirs.append(dir_path)
+        directory_status = _directory_status()
+        missing_dirs = [d for d, exists in directory_status.items() if not exists]
         
         health_status = {
             "status": "healthy",
@@ -40,10 +54,10 @@ async def health_check():
                 "cpu_percent": cpu_percent,
                 "memory_percent": memory.percent,
                 "disk_percent": disk.percent,
-                "uptime_seconds": psutil.boot_time()
+                "uptime_seconds": time.time() - _BOOT_TIME
             },
-            "directories": directory_status,
-            "environment": os.getenv('ENVIRONMENT', 'development')
+            "directories": dict(directory_status),
+            "environment": _ENVIRONMENT
         }
         
         # Check thresholds
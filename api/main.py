@@ -1,14 +1,23 @@
 # api/main.py
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import List, Literal, Optional, Dict, Any, Tuple
 import uvicorn
+import numpy as np
+import orjson
 import pandas as pd
+from numba import njit, prange
 from datetime import datetime, timedelta
+from itertools import count, islice
 import asyncio
 import json
 import logging
+import os
+import sys
+import time
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -16,7 +25,20 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="GuardianSensor API", 
               description="Child-in-Vehicle Safety System API",
-              version="1.0.0")
+              version="1.0.0",
+              default_response_class=ORJSONResponse)
+
+class HealthExemptGZipMiddleware(GZipMiddleware):
+    """GZip responses, except health probes which are small and latency-sensitive"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/health"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress larger payloads such as /dashboard
+app.add_middleware(HealthExemptGZipMiddleware, minimum_size=500, compresslevel=5)
 
 # CORS middleware
 app.add_middleware(
@@ -29,6 +51,8 @@ app.add_middleware(
 
 # Data models
 class SensorData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     temperature_c: float
     weight_left_kg: float
     weight_right_kg: float
@@ -51,49 +75,146 @@ class RiskAssessment(BaseModel):
     recommendation: str
 
 # Global state (in production, use a database)
-alerts_db = []
-sensor_data_history = []
+# Bounded so the simulator can't grow memory forever
+MAX_ALERTS = 10000
+alerts_db: Dict[int, Dict[str, Any]] = {}  # Keyed by alert id, in insertion order
+
+# Sensor history as per-column circular NumPy buffers (the only copy of
+# it), so dashboard aggregates are vectorized and the history can be
+# served column-wise
+HISTORY_BUFFER_SIZE = 1024
+_history_columns = {
+    "temperature_c": np.zeros(HISTORY_BUFFER_SIZE, dtype=np.float64),
+    "weight_left_kg": np.zeros(HISTORY_BUFFER_SIZE, dtype=np.float64),
+    "weight_right_kg": np.zeros(HISTORY_BUFFER_SIZE, dtype=np.float64),
+    "motion_detected": np.zeros(HISTORY_BUFFER_SIZE, dtype=np.bool_),
+    "door_state": np.empty(HISTORY_BUFFER_SIZE, dtype=object),
+    "engine_state": np.empty(HISTORY_BUFFER_SIZE, dtype=object),
+    "timestamp": np.empty(HISTORY_BUFFER_SIZE, dtype=object),
+    "received_at": np.empty(HISTORY_BUFFER_SIZE, dtype=object),
+}
+_history_count = 0  # Total samples written; the next write goes to _history_count % size
+
+# Alerts indexed by status and id, kept in sync by send_alert/resolve_alert
+alerts_by_status: Dict[str, Dict[int, Dict[str, Any]]] = {
+    "active": {},
+    "resolved": {}
+}
+
+# Short-lived /dashboard response cache shared by concurrent pollers:
+# history layout -> (monotonic time, payload), cleared whenever sensor or
+# alert data changes
+DASHBOARD_CACHE_TTL = 1.0  # seconds
+_dash_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+def _invalidate_dashboard_cache():
+    _dash_cache.clear()
+
+def _record_sensor_sample(sensor_dict: Dict[str, Any]):
+    """Append a sensor sample to the history buffers"""
+    global _history_count
+    slot = _history_count % HISTORY_BUFFER_SIZE
+    for name, column in _history_columns.items():
+        column[slot] = sensor_dict[name]
+    _history_count += 1
+    _invalidate_dashboard_cache()
+
+def _recent_slots(n: int) -> np.ndarray:
+    """Buffer positions of the last n recorded samples, oldest first"""
+    n = min(n, _history_count, HISTORY_BUFFER_SIZE)
+    return np.arange(_history_count - n, _history_count) % HISTORY_BUFFER_SIZE
+
+def _recent_temperatures(n: int) -> np.ndarray:
+    """Return the last n recorded temperatures, oldest first"""
+    return _history_columns["temperature_c"][_recent_slots(n)]
+
+def _recent_history_columns(n: int) -> Dict[str, Any]:
+    """Return the last n samples column-wise, oldest first.
+
+    Numeric columns stay NumPy arrays (ORJSONResponse serializes them
+    natively); object columns are converted to lists.
+    """
+    slots = _recent_slots(n)
+    return {
+        name: column[slots].tolist() if column.dtype == object else column[slots]
+        for name, column in _history_columns.items()
+    }
+
+def _recent_history_records(n: int) -> List[Dict[str, Any]]:
+    """Return the last n samples as dicts, oldest first"""
+    slots = _recent_slots(n)
+    columns = [column[slots].tolist() for column in _history_columns.values()]
+    return [dict(zip(_history_columns, row)) for row in zip(*columns)]
+
+def _tail(items, n: int) -> list:
+    """Return the last n items of a deque or dict view, oldest first"""
+    return list(islice(reversed(items), max(n, 0)))[::-1]
+
+# Explicit signature: compiled (or loaded from cache) at import, not on first request
+@njit("UniTuple(f8, 5)(f8, f8, f8, b1, b1, b1)", cache=True)
+def _risk_kernel(temp, weight_left, weight_right, motion, door_closed, engine_off):
+    """Compiled risk sub-scores: (temperature, time, occupancy, motion, state)"""
+    
+    # 1. Temperature risk (0-1), linear from 26-40°C
+    if temp > 40:
+        temp_risk = 1.0
+    elif temp > 26:
+        temp_risk = (temp - 26) / 14
+    else:
+        temp_risk = 0.0
+    
+    # 2. Time risk (based on how long car has been off)
+    # In real system, would track elapsed time
+    time_risk = 0.0  # Placeholder
+    
+    # 3. Occupancy risk - pattern: child in left seat, no adult in right
+    if weight_left > 2 and weight_left < 25 and weight_right < 5:
+        occupancy_risk = 0.8
+    elif weight_left > 2 and weight_left < 25:
+        occupancy_risk = 0.5
+    else:
+        occupancy_risk = 0.0
+    
+    # 4. Motion risk (no motion is worse)
+    motion_risk = 0.0 if motion else 0.3
+    
+    # 5. Door/engine state
+    state_risk = 0.4 if (door_closed and engine_off) else 0.0
+    
+    return temp_risk, time_risk, occupancy_risk, motion_risk, state_risk
+
+@njit(parallel=True, cache=True)
+def _risk_kernel_batch(temp, weight_left, weight_right, motion, door_closed, engine_off):
+    """Apply _risk_kernel to every sample; returns an (n, 5) array of sub-scores"""
+    n = temp.shape[0]
+    out = np.empty((n, 5))
+    for i in prange(n):
+        out[i, 0], out[i, 1], out[i, 2], out[i, 3], out[i, 4] = _risk_kernel(
+            temp[i], weight_left[i], weight_right[i],
+            motion[i], door_closed[i], engine_off[i]
+        )
+    return out
 
 class RiskCalculator:
     """Calculates risk score based on sensor data"""
     
     @staticmethod
-    def calculate_risk(sensor_data: Dict[str, Any]) -> RiskAssessment:
+    def calculate_risk(sensor_data: SensorData) -> RiskAssessment:
         """Calculate comprehensive risk score"""
+        return RiskAssessment(**RiskCalculator.calculate_risk_scores(sensor_data))
+    
+    @staticmethod
+    def calculate_risk_scores(sensor_data: SensorData) -> Dict[str, Any]:
+        """Calculate the risk score as a plain dict, skipping model validation"""
         
-        # 1. Temperature risk (0-1)
-        temp = sensor_data.get('temperature_c', 25)
-        if temp > 40:
-            temp_risk = 1.0
-        elif temp > 26:
-            temp_risk = (temp - 26) / 14  # Linear from 26-40°C
-        else:
-            temp_risk = 0.0
-        
-        # 2. Time risk (based on how long car has been off)
-        # In real system, would track elapsed time
-        time_risk = 0.0  # Placeholder
-        
-        # 3. Occupancy risk
-        weight_left = sensor_data.get('weight_left_kg', 0)
-        weight_right = sensor_data.get('weight_right_kg', 0)
-        
-        # Pattern: Child in left seat, no adult in right
-        if weight_left > 2 and weight_left < 25 and weight_right < 5:
-            occupancy_risk = 0.8
-        elif weight_left > 2 and weight_left < 25:
-            occupancy_risk = 0.5
-        else:
-            occupancy_risk = 0.0
-        
-        # 4. Motion risk (no motion is worse)
-        motion = sensor_data.get('motion_detected', True)
-        motion_risk = 0.0 if motion else 0.3
-        
-        # 5. Door/engine state
-        door_closed = sensor_data.get('door_state') == 'closed'
-        engine_off = sensor_data.get('engine_state') == 'off'
-        state_risk = 0.4 if (door_closed and engine_off) else 0.0
+        temp_risk, time_risk, occupancy_risk, motion_risk, state_risk = _risk_kernel(
+            float(sensor_data.temperature_c),
+            float(sensor_data.weight_left_kg),
+            float(sensor_data.weight_right_kg),
+            bool(sensor_data.motion_detected),
+            sensor_data.door_state == 'closed',
+            sensor_data.engine_state == 'off'
+        )
         
         # Total risk (weighted average)
         total_risk = (
@@ -114,51 +235,101 @@ class RiskCalculator:
         else:
             recommendation = "SAFE: No immediate risk detected"
         
-        return RiskAssessment(
-            temperature_risk=round(temp_risk, 2),
-            time_risk=round(time_risk, 2),
-            occupancy_risk=round(occupancy_risk, 2),
-            total_risk=round(total_risk, 2),
-            recommendation=recommendation
+        return {
+            "temperature_risk": round(temp_risk, 2),
+            "time_risk": round(time_risk, 2),
+            "occupancy_risk": round(occupancy_risk, 2),
+            "total_risk": round(total_risk, 2),
+            "recommendation": recommendation
+        }
+    
+    @staticmethod
+    def calculate_risk_batch(sensor_data: pd.DataFrame) -> pd.DataFrame:
+        """Calculate risk scores for many samples at once (e.g. history backfill)"""
+        
+        risks = _risk_kernel_batch(
+            sensor_data["temperature_c"].to_numpy(dtype=np.float64),
+            sensor_data["weight_left_kg"].to_numpy(dtype=np.float64),
+            sensor_data["weight_right_kg"].to_numpy(dtype=np.float64),
+            sensor_data["motion_detected"].to_numpy(dtype=np.bool_),
+            (sensor_data["door_state"] == "closed").to_numpy(dtype=np.bool_),
+            (sensor_data["engine_state"] == "off").to_numpy(dtype=np.bool_)
+        )
+        temp_risk, time_risk, occupancy_risk, motion_risk, state_risk = risks.T
+        
+        total_risk = (
+            temp_risk * 0.3 +
+            occupancy_risk * 0.3 +
+            state_risk * 0.2 +
+            motion_risk * 0.1 +
+            time_risk * 0.1
+        )
+        
+        recommendation = np.select(
+            [total_risk > 0.7, total_risk > 0.4, total_risk > 0.2],
+            ["EMERGENCY: Immediate intervention required",
+             "WARNING: Check vehicle immediately",
+             "CAUTION: Monitor situation"],
+            default="SAFE: No immediate risk detected"
         )
+        
+        return pd.DataFrame({
+            "temperature_risk": temp_risk.round(2),
+            "time_risk": time_risk.round(2),
+            "occupancy_risk": occupancy_risk.round(2),
+            "total_risk": total_risk.round(2),
+            "recommendation": recommendation
+        }, index=sensor_data.index)
+
+# Alert templates per level: (title, message format, actions)
+_ALERT_TEMPLATES = {
+    "warning": (
+        "Vehicle Safety Warning!",
+        "Unattended child detected in vehicle {vid}",
+        ("Check vehicle", "Acknowledge")
+    ),
+    "critical": (
+        "Critical Alert!!",
+        "Dangerous conditions in vehicle {vid}. Temperature: {t}°C",
+        ("Emergency contact", "View live feed")
+    ),
+    "emergency": (
+        "EMERGENCY",
+        "Child in distress in vehicle {vid}. Contacting emergency services.",
+        ("Call 911", "Share location")
+    )
+}
+_UNKNOWN_ALERT_TEMPLATE = ("", "", ())
+
+# Monotonic alert ids, independent of how many alerts the deque retains
+_alert_ids = count(1)
 
 class AlertSystem:
     """Manages alert notifications"""
     
     @staticmethod
-    def send_alert(level: str, vehicle_id: str, risk_data: Dict[str, Any]):
+    async def send_alert(level: str, vehicle_id: str, risk_data: Dict[str, Any]):
         """Simulate sending alerts to different channels"""
         
-        alert_messages = {
-            "warning": {
-                "title": "Vehicle Safety Warning!",
-                "message": f"Unattended child detected in vehicle {vehicle_id}",
-                "actions": ["Check vehicle", "Acknowledge"]
-            },
-            "critical": {
-                "title": "Critical Alert!!",
-                "message": f"Dangerous conditions in vehicle {vehicle_id}. Temperature: {risk_data.get('temperature', 0)}°C",
-                "actions": ["Emergency contact", "View live feed"]
-            },
-            "emergency": {
-                "title": "EMERGENCY",
-                "message": f"Child in distress in vehicle {vehicle_id}. Contacting emergency services.",
-                "actions": ["Call 911", "Share location"]
-            }
-        }
+        title, message_template, actions = _ALERT_TEMPLATES.get(level, _UNKNOWN_ALERT_TEMPLATE)
         
         alert = {
-            "id": len(alerts_db) + 1,
+            "id": next(_alert_ids),
             "level": level,
             "vehicle_id": vehicle_id,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": datetime.now(),
             "data": risk_data,
-            "message": alert_messages.get(level, {}).get("message", ""),
-            "actions": alert_messages.get(level, {}).get("actions", []),
+            "message": message_template.format(vid=vehicle_id, t=risk_data.get('temperature', 0)),
+            "actions": actions,
             "status": "active"
         }
         
-        alerts_db.append(alert)
+        alerts_db[alert["id"]] = alert
+        alerts_by_status["active"][alert["id"]] = alert
+        if len(alerts_db) > MAX_ALERTS:
+            oldest = alerts_db.pop(next(iter(alerts_db)))
+            alerts_by_status[oldest["status"]].pop(oldest["id"], None)
+        _invalidate_dashboard_cache()
         logger.info(f"Alert sent: {level} for vehicle {vehicle_id}")
         
         # In production, would send:
@@ -166,78 +337,85 @@ class AlertSystem:
         # 2. SMS
         # 3. Email
         # 4. Emergency services API call
+        # Blocking clients for these should be wrapped in asyncio.to_thread()
+        # so they don't stall the event loop
         
         return alert
 
+def _alert_level(total_risk: float) -> Optional[str]:
+    """Map a total risk score to the alert level it triggers, if any"""
+    if total_risk > 0.7:
+        return "emergency"
+    elif total_risk > 0.4:
+        return "critical"
+    elif total_risk > 0.2:
+        return "warning"
+    return None
+
 # API Endpoints
 
+# Constant response bodies, serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "service": "GuardianSensor API",
+    "version": "1.0.0",
+    "endpoints": [
+        "/sensors - POST sensor data",
+        "/risk - GET risk assessment",
+        "/alerts - GET alerts",
+        "/dashboard - GET dashboard data"
+    ]
+})
+_HEALTH_PREFIX = orjson.dumps({
+    "status": "healthy",
+    "service": "GuardianSensor API",
+    "version": "1.0.0"
+})[:-1] + b',"timestamp":"'
+
 @app.get("/")
 async def root():
-    return {
-        "service": "GuardianSensor API",
-        "version": "1.0.0",
-        "endpoints": [
-            "/sensors - POST sensor data",
-            "/risk - GET risk assessment",
-            "/alerts - GET alerts",
-            "/dashboard - GET dashboard data"
-        ]
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
-@app.post("/sensors", response_model=Dict[str, Any])
-async def receive_sensor_data(data: SensorData):
+@app.post("/sensors")
+async def receive_sensor_data(data: SensorData, background_tasks: BackgroundTasks):
     """Receive sensor data from vehicle"""
     
     # Convert to dict
-    sensor_dict = data.dict()
-    sensor_dict["received_at"] = datetime.now().isoformat()
+    sensor_dict = data.model_dump()
+    sensor_dict["received_at"] = datetime.now()
     
     # Store in history (in production, use database)
-    sensor_data_history.append(sensor_dict)
+    _record_sensor_sample(sensor_dict)
     
     # Calculate risk
-    risk_calc = RiskCalculator()
-    risk_assessment = risk_calc.calculate_risk(sensor_dict)
-    
-    # Trigger alerts if needed
-    if risk_assessment.total_risk > 0.7:
-        alert_system = AlertSystem()
-        alert_system.send_alert(
-            level="emergency",
-            vehicle_id="test_vehicle_001",
-            risk_data=risk_assessment.dict()
-        )
-    elif risk_assessment.total_risk > 0.4:
-        alert_system = AlertSystem()
-        alert_system.send_alert(
-            level="critical",
-            vehicle_id="test_vehicle_001",
-            risk_data=risk_assessment.dict()
-        )
-    elif risk_assessment.total_risk > 0.2:
-        alert_system = AlertSystem()
-        alert_system.send_alert(
-            level="warning",
+    risk_assessment = RiskCalculator.calculate_risk_scores(data)
+    
+    # Trigger alerts if needed (sent after the response is returned)
+    level = _alert_level(risk_assessment["total_risk"])
+    if level:
+        background_tasks.add_task(
+            AlertSystem.send_alert,
+            level=level,
             vehicle_id="test_vehicle_001",
-            risk_data=risk_assessment.dict()
+            risk_data=risk_assessment
         )
     
-    return {
+    # Already-validated data: serialize once, without a response_model pass
+    return ORJSONResponse({
         "status": "success",
         "message": "Sensor data received",
-        "risk_assessment": risk_assessment.dict(),
-        "timestamp": datetime.now().isoformat()
-    }
+        "risk_assessment": risk_assessment,
+        "timestamp": datetime.now()
+    })
 
 @app.get("/risk", response_model=RiskAssessment)
 async def get_risk_assessment():
     """Get current risk assessment"""
-    if not sensor_data_history:
+    if not _history_count:
         raise HTTPException(status_code=404, detail="No sensor data available")
     
-    latest_data = sensor_data_history[-1]
-    risk_calc = RiskCalculator()
-    return risk_calc.calculate_risk(latest_data)
+    # History entries were validated on the way in; rebuild without re-validating
+    latest_data = SensorData.model_construct(**_recent_history_records(1)[0])
+    return RiskCalculator.calculate_risk(latest_data)
 
 @app.get("/alerts")
 async def get_alerts(status: Optional[str] = None, limit: int = 10):
@@ -245,20 +423,30 @@ async def get_alerts(status: Optional[str] = None, limit: int = 10):
     filtered_alerts = alerts_db
     
     if status:
-        filtered_alerts = [a for a in alerts_db if a["status"] == status]
+        filtered_alerts = alerts_by_status.get(status, {})
     
     return {
         "count": len(filtered_alerts),
-        "alerts": filtered_alerts[-limit:]  # Most recent first
+        "alerts": _tail(filtered_alerts.values(), limit)  # Most recent first
     }
 
 @app.get("/dashboard")
-async def get_dashboard_data():
-    """Get data for dashboard visualization"""
+async def get_dashboard_data(history: Literal["records", "columns"] = "records"):
+    """Get data for dashboard visualization
+    
+    The last 20 sensor samples come back as `sensor_history`, a list of
+    records, or with `?history=columns` as `sensor_history_columns`, one
+    array per field.
+    """
     
-    if not sensor_data_history:
+    now = time.monotonic()
+    cached = _dash_cache.get(history)
+    if cached is not None and now - cached[0] < DASHBOARD_CACHE_TTL:
+        return ORJSONResponse(cached[1])
+    
+    if not _history_count:
         # Return sample data
-        return {
+        return ORJSONResponse({
             "metrics": {
                 "total_alerts": 0,
                 "active_alerts": 0,
@@ -266,38 +454,49 @@ async def get_dashboard_data():
                 "risk_trend": "stable"
             },
             "recent_alerts": [],
-            "sensor_history": []
-        }
+            **({"sensor_history_columns": {name: [] for name in _history_columns}}
+               if history == "columns" else {"sensor_history": []})
+        })
     
     # Calculate metrics
-    recent_alerts = alerts_db[-5:] if alerts_db else []
-    recent_sensors = sensor_data_history[-20:] if sensor_data_history else []
+    recent_alerts = _tail(alerts_db.values(), 5)
     
-    active_alerts = len([a for a in alerts_db if a.get("status") == "active"])
+    active_alerts = len(alerts_by_status["active"])
     
     # Temperature stats
-    temperatures = [s.get("temperature_c", 0) for s in sensor_data_history[-10:]]
-    avg_temp = sum(temperatures) / len(temperatures) if temperatures else 0
+    temperatures = _recent_temperatures(10)
+    avg_temp = float(temperatures.mean()) if temperatures.size else 0
     
-    return {
+    payload = {
         "metrics": {
             "total_alerts": len(alerts_db),
             "active_alerts": active_alerts,
             "avg_temperature": round(avg_temp, 1),
             "risk_trend": "increasing" if len(alerts_db) > 2 else "stable"
         },
-        "recent_alerts": recent_alerts,
-        "sensor_history": recent_sensors
+        "recent_alerts": recent_alerts
     }
+    if history == "columns":
+        payload["sensor_history_columns"] = _recent_history_columns(20)
+    else:
+        payload["sensor_history"] = _recent_history_records(20)
+    
+    _dash_cache[history] = (now, payload)
+    return ORJSONResponse(payload)
 
 @app.post("/alerts/{alert_id}/resolve")
 async def resolve_alert(alert_id: int):
     """Mark alert as resolved"""
-    if alert_id < 1 or alert_id > len(alerts_db):
+    alert = alerts_db.get(alert_id)
+    if alert is None:
         raise HTTPException(status_code=404, detail="Alert not found")
     
-    alerts_db[alert_id - 1]["status"] = "resolved"
-    alerts_db[alert_id - 1]["resolved_at"] = datetime.now().isoformat()
+    if alert["status"] == "active":
+        del alerts_by_status["active"][alert_id]
+        alerts_by_status["resolved"][alert_id] = alert
+    alert["status"] = "resolved"
+    alert["resolved_at"] = datetime.now()
+    _invalidate_dashboard_cache()
     
     return {"status": "success", "message": f"Alert {alert_id} resolved"}
 
@@ -305,42 +504,69 @@ async def resolve_alert(alert_id: int):
 async def simulate_sensor_updates():
     """Background task that simulates incoming sensor data"""
     import random
-    import asyncio
+    
+    rng = random.Random()
+    # Keep references to in-flight alert tasks so they aren't garbage collected
+    pending_alerts = set()
     
     while True:
         await asyncio.sleep(10)  # Every 10 seconds
         
-        if len(sensor_data_history) < 100:  # Don't overload
-            simulated_data = SensorData(
-                temperature_c=round(random.uniform(20, 45), 1),
-                weight_left_kg=round(random.uniform(0, 20), 1),
-                weight_right_kg=round(random.uniform(0, 80), 1),
-                motion_detected=random.random() > 0.5,
-                door_state=random.choice(["open", "closed"]),
-                engine_state=random.choice(["on", "off"]),
-                timestamp=datetime.now().isoformat()
-            )
+        if _history_count < 100:  # Don't overload
+            # Synthetic data is well-typed by construction, so it is stored
+            # directly instead of going through SensorData validation
+            now = datetime.now()
+            sensor_dict = {
+                "temperature_c": round(rng.uniform(20, 45), 1),
+                "weight_left_kg": round(rng.uniform(0, 20), 1),
+                "weight_right_kg": round(rng.uniform(0, 80), 1),
+                "motion_detected": rng.random() > 0.5,
+                "door_state": rng.choice(("open", "closed")),
+                "engine_state": rng.choice(("on", "off")),
+                "timestamp": now.isoformat(),
+                "received_at": now
+            }
+            _record_sensor_sample(sensor_dict)
             
-            # Process the data
-            await receive_sensor_data(simulated_data)
+            risk_assessment = RiskCalculator.calculate_risk_scores(SensorData.model_construct(**sensor_dict))
+            level = _alert_level(risk_assessment["total_risk"])
+            if level:
+                task = asyncio.create_task(
+                    AlertSystem.send_alert(level, "test_vehicle_001", risk_assessment)
+                )
+                pending_alerts.add(task)
+                task.add_done_callback(pending_alerts.discard)
             
-            logger.info(f"Simulated sensor update: {simulated_data.temperature_c}°C")
+            logger.info(f"Simulated sensor update: {sensor_dict['temperature_c']}°C")
 
 @app.on_event("startup")
 async def startup_event():
     """Start background tasks on startup"""
+    # uvicorn falls back to the stdlib loop if uvloop fails to import
+    loop = asyncio.get_running_loop()
+    logger.info(f"Event loop: {type(loop).__module__}.{type(loop).__name__}")
+    # Exercise the risk kernel once so the first request doesn't pay dispatch setup
+    _risk_kernel(25.0, 0.0, 0.0, True, False, False)
     asyncio.create_task(simulate_sensor_updates())
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for CI/CD and monitoring"""
-    return {
-        "status": "healthy",
-        "service": "GuardianSensor API",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+    body = _HEALTH_PREFIX + datetime.now().isoformat().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
 
 # Run the server
 if __name__ == "__main__":
-    uvicorn.run("api.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Only watch for file changes in development; uvloop is not available on Windows.
+    # Alerts and sensor history live in process memory, so each worker keeps its
+    # own copy: only raise API_WORKERS once state is moved to a shared store.
+    reload = os.getenv("ENVIRONMENT", "development") == "development"
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=reload,
+        workers=1 if reload else int(os.getenv("API_WORKERS", "1")),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
\ No newline at end of file
@@ -45,6 +45,117 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Reuse one HTTP session across Streamlit reruns to keep the API connection alive
+if "client" not in st.session_state:
+    st.session_state["client"] = requests.Session()
+client = st.session_state["client"]
+
+# Cached data and figures (Streamlit reruns the whole script on every interaction)
+@st.cache_data(ttl=10)
+def _make_temperature_series():
+    """Generate sample temperature data"""
+    hours = list(range(24))
+    temps = [25 + np.sin(h/3) * 10 + np.random.randn() * 2 for h in hours]
+    return hours, temps
+
+@st.cache_resource(ttl=10)
+def _make_temperature_figure():
+    """Temperature trend chart with danger/warning zones"""
+    hours, temps = _make_temperature_series()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=hours, y=temps, mode='lines+markers', name='Temperature',
+                            line=dict(color='red', width=3)))
+    
+    # Add danger zone
+    fig.add_hrect(y0=40, y1=50, line_width=0, fillcolor="red", opacity=0.2,
+                 annotation_text="Danger Zone", annotation_position="top left")
+    fig.add_hrect(y0=26, y1=40, line_width=0, fillcolor="orange", opacity=0.2,
+                 annotation_text="Warning Zone", annotation_position="top left")
+    
+    fig.update_layout(
+        xaxis_title="Hours",
+        yaxis_title="Temperature (°C)",
+        height=300
+    )
+    return fig
+
+@st.cache_data(ttl=60)
+def _make_risk_breakdown():
+    """Risk breakdown by factor"""
+    return pd.DataFrame({
+        'Factor': ['Temperature', 'Occupancy', 'Time Elapsed', 'Vehicle State'],
+        'Risk Score': [0.8, 0.9, 0.6, 0.5]
+    })
+
+@st.cache_resource(ttl=60)
+def _make_risk_figure():
+    """Risk components bar chart"""
+    fig = px.bar(_make_risk_breakdown(), x='Factor', y='Risk Score', color='Risk Score',
+                color_continuous_scale=['green', 'yellow', 'red'])
+    fig.update_layout(height=300)
+    return fig
+
+@st.cache_data(ttl=10)
+def _make_sensor_df():
+    """Generate sample sensor data"""
+    time_points = pd.date_range(start='2024-01-15 08:00', periods=100, freq='T')
+    return pd.DataFrame({
+        'timestamp': time_points,
+        'temperature': 25 + np.cumsum(np.random.randn(100) * 0.1) + np.sin(np.arange(100)/10) * 5,
+        'weight_left': np.random.choice([0, 15, 18], 100, p=[0.3, 0.5, 0.2]),
+        'weight_right': np.random.choice([0, 70, 75], 100, p=[0.6, 0.3, 0.1]),
+        'motion': np.random.choice([True, False], 100, p=[0.7, 0.3])
+    })
+
+@st.cache_resource(ttl=10)
+def _make_sensor_figures():
+    """Sensor timeline, summary statistics and correlation heatmap"""
+    sensor_df = _make_sensor_df()
+    
+    # Multi-axis chart
+    timeline_fig = go.Figure()
+    
+    timeline_fig.add_trace(go.Scatter(
+        x=sensor_df['timestamp'],
+        y=sensor_df['temperature'],
+        name="Temperature",
+        yaxis="y1",
+        line=dict(color='red')
+    ))
+    
+    timeline_fig.add_trace(go.Scatter(
+        x=sensor_df['timestamp'],
+        y=sensor_df['weight_left'],
+        name="Left Seat Weight",
+        yaxis="y2",
+        line=dict(color='blue')
+    ))
+    
+    timeline_fig.add_trace(go.Scatter(
+        x=sensor_df['timestamp'],
+        y=sensor_df['weight_right'],
+        name="Right Seat Weight",
+        yaxis="y2",
+        line=dict(color='green')
+    ))
+    
+    timeline_fig.update_layout(
+        title="Sensor Data Timeline",
+        yaxis=dict(title="Temperature (°C)", side="left"),
+        yaxis2=dict(title="Weight (kg)", side="right", overlaying="y"),
+        xaxis_title="Time",
+        height=400,
+        hovermode="x unified"
+    )
+    
+    # Correlation heatmap
+    corr_matrix = sensor_df[['temperature', 'weight_left', 'weight_right']].corr()
+    corr_fig = px.imshow(corr_matrix, text_auto=True, color_continuous_scale='RdBu')
+    corr_fig.update_layout(title="Sensor Correlations")
+    
+    return timeline_fig, sensor_df.describe(), corr_fig
+
 # Title
 st.markdown('<h1 class="main-header">🚗 GuardianSeat Safety Dashboard</h1>', unsafe_allow_html=True)
 
@@ -85,7 +196,7 @@ with st.sidebar:
                 "engine_state": "off",
                 "timestamp": datetime.now().isoformat()
             }
-            response = requests.post("http://localhost:8000/sensors", json=test_data)
+            response = client.post("http://localhost:8000/sensors", json=test_data)
             st.success("Emergency scenario triggered!")
     
     with col2:
@@ -100,7 +211,7 @@ with st.sidebar:
                 "engine_state": "on",
                 "timestamp": datetime.now().isoformat()
             }
-            response = requests.post("http://localhost:8000/sensors", json=test_data)
+            response = client.post("http://localhost:8000/sensors", json=test_data)
             st.success("Safe scenario triggered!")
 
 # Main dashboard layout
@@ -136,41 +247,11 @@ with tab1:
     
     with col1:
         st.subheader("Temperature Trend")
-        
-        # Generate sample temperature data
-        hours = list(range(24))
-        temps = [25 + np.sin(h/3) * 10 + np.random.randn() * 2 for h in hours]
-        
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(x=hours, y=temps, mode='lines+markers', name='Temperature',
-                                line=dict(color='red', width=3)))
-        
-        # Add danger zone
-        fig.add_hrect(y0=40, y1=50, line_width=0, fillcolor="red", opacity=0.2,
-                     annotation_text="Danger Zone", annotation_position="top left")
-        fig.add_hrect(y0=26, y1=40, line_width=0, fillcolor="orange", opacity=0.2,
-                     annotation_text="Warning Zone", annotation_position="top left")
-        
-        fig.update_layout(
-            xaxis_title="Hours",
-            yaxis_title="Temperature (°C)",
-            height=300
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_make_temperature_figure(), use_container_width=True)
     
     with col2:
         st.subheader("Risk Components")
-        
-        # Risk breakdown
-        risk_data = pd.DataFrame({
-            'Factor': ['Temperature', 'Occupancy', 'Time Elapsed', 'Vehicle State'],
-            'Risk Score': [0.8, 0.9, 0.6, 0.5]
-        })
-        
-        fig = px.bar(risk_data, x='Factor', y='Risk Score', color='Risk Score',
-                    color_continuous_scale=['green', 'yellow', 'red'])
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_make_risk_figure(), use_container_width=True)
     
     # Vehicle status
     st.markdown("---")
@@ -250,53 +331,8 @@ with tab3:
     # Sensor data visualization
     st.subheader("Sensor Data Analysis")
     
-    # Generate sample sensor data
-    time_points = pd.date_range(start='2024-01-15 08:00', periods=100, freq='T')
-    sensor_df = pd.DataFrame({
-        'timestamp': time_points,
-        'temperature': 25 + np.cumsum(np.random.randn(100) * 0.1) + np.sin(np.arange(100)/10) * 5,
-        'weight_left': np.random.choice([0, 15, 18], 100, p=[0.3, 0.5, 0.2]),
-        'weight_right': np.random.choice([0, 70, 75], 100, p=[0.6, 0.3, 0.1]),
-        'motion': np.random.choice([True, False], 100, p=[0.7, 0.3])
-    })
-    
-    # Multi-axis chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=sensor_df['timestamp'],
-        y=sensor_df['temperature'],
-        name="Temperature",
-        yaxis="y1",
-        line=dict(color='red')
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=sensor_df['timestamp'],
-        y=sensor_df['weight_left'],
-        name="Left Seat Weight",
-        yaxis="y2",
-        line=dict(color='blue')
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=sensor_df['timestamp'],
-        y=sensor_df['weight_right'],
-        name="Right Seat Weight",
-        yaxis="y2",
-        line=dict(color='green')
-    ))
-    
-    fig.update_layout(
-        title="Sensor Data Timeline",
-        yaxis=dict(title="Temperature (°C)", side="left"),
-        yaxis2=dict(title="Weight (kg)", side="right", overlaying="y"),
-        xaxis_title="Time",
-        height=400,
-        hovermode="x unified"
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    timeline_fig, sensor_summary, corr_fig = _make_sensor_figures()
+    st.plotly_chart(timeline_fig, use_container_width=True)
     
     # Statistics
     st.subheader("Statistical Summary")
@@ -304,14 +340,10 @@ with tab3:
     col1, col2 = st.columns(2)
     
     with col1:
-        st.dataframe(sensor_df.describe())
+        st.dataframe(sensor_summary)
     
     with col2:
-        # Correlation heatmap
-        corr_matrix = sensor_df[['temperature', 'weight_left', 'weight_right']].corr()
-        fig = px.imshow(corr_matrix, text_auto=True, color_continuous_scale='RdBu')
-        fig.update_layout(title="Sensor Correlations")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(corr_fig, use_container_width=True)
 
 with tab4:
     st.header("⚙️ System Configuration")
@@ -37,22 +37,28 @@ class CompatibleMMWaveProcessor:
         self._init_filters()
     
     def _init_filters(self) -> None:
-        """Initialize digital filters for signal processing."""
+        """Initialize digital filters for signal processing.
+        
+        Filters are stored as float32 second-order sections, which are
+        better conditioned and faster to apply than (b, a) transfer
+        functions, and keep filtering in single precision.
+        """
         try:
             # Breathing detection filter
-            self.breathing_b, self.breathing_a = signal.butter(
-                4, self.BREATHING_FREQ_RANGE, btype='band', fs=self.fs
-            )
+            self.breathing_sos = signal.butter(
+                4, self.BREATHING_FREQ_RANGE, btype='band', fs=self.fs, output='sos'
+            ).astype(np.float32)
             
             # Heart rate detection filter
-            self.heartbeat_b, self.heartbeat_a = signal.butter(
-                4, self.HEARTBEAT_FREQ_RANGE, btype='band', fs=self.fs
-            )
+            self.heartbeat_sos = signal.butter(
+                4, self.HEARTBEAT_FREQ_RANGE, btype='band', fs=self.fs, output='sos'
+            ).astype(np.float32)
             
             # Notch filter for power line interference
-            self.notch_b, self.notch_a = signal.iirnotch(
+            notch_b, notch_a = signal.iirnotch(
                 self.NOTCH_FREQ, self.NOTCH_QUALITY, self.fs
             )
+            self.notch_sos = signal.tf2sos(notch_b, notch_a).astype(np.float32)
         except Exception as e:
             logger.error(f"Filter initialization failed: {e}")
             raise
@@ -73,19 +79,20 @@ class CompatibleMMWaveProcessor:
             raise ValueError("Invalid I/Q data input")
         
         try:
-            # Preprocessing
-            iq_array = np.array(iq_data, dtype=complex)
-            iq_centered = iq_array - np.mean(iq_array)
+            # Preprocessing: np.array always copies, so the DC offset can be
+            # removed in place with one complex mean and subtraction
+            iq_array = np.array(iq_data, dtype=np.complex64)
+            iq_array -= iq_array.mean()
             
             # Apply notch filter
-            iq_filtered = signal.filtfilt(self.notch_b, self.notch_a, iq_centered)
+            iq_filtered = signal.sosfiltfilt(self.notch_sos, iq_array)
             
             # Extract amplitude
             amplitude = np.abs(iq_filtered)
             
             # Apply vital sign filters
-            breathing = signal.filtfilt(self.breathing_b, self.breathing_a, amplitude)
-            heartbeat = signal.filtfilt(self.heartbeat_b, self.heartbeat_a, amplitude)
+            breathing = signal.sosfiltfilt(self.breathing_sos, amplitude)
+            heartbeat = signal.sosfiltfilt(self.heartbeat_sos, amplitude)
             
             # Extract vital sign metrics
             breathing_bpm, breathing_conf = self._extract_vital_sign(breathing, 0.8)
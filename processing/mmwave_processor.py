@@ -1,12 +1,29 @@
 import numpy as np
 import pandas as pd
 import scipy.signal as signal
-from scipy.fft import fft, fftfreq
-import matplotlib.pyplot as plt
+from scipy.fft import rfft, fftfreq
+from scipy.ndimage import uniform_filter1d
+from matplotlib.figure import Figure
 from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
 import json
 import os
 
+try:
+    # Optional: FFTW with cached plans is faster than scipy.fft for repeated fixed-size transforms
+    import pyfftw
+    import pyfftw.interfaces.scipy_fft
+    pyfftw.interfaces.cache.enable()
+    _rfft = pyfftw.interfaces.scipy_fft.rfft
+except ImportError:
+    _rfft = rfft
+
+try:
+    # Optional: fuses elementwise expressions and reductions into one multithreaded pass
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 class MMWaveProcessor:
     """
     Real-time mmWave radar signal processing pipeline
@@ -24,27 +41,39 @@ class MMWaveProcessor:
         # Initialize filters
         self._init_filters()
         
+        # Positive-frequency bins of the spectrum, fixed for a given fs/fft_size
+        self._spectrum_freqs = fftfreq(self.fft_size, 1/self.fs)[:self.fft_size//2]
+        
+        # Hanning windows keyed by signal length
+        self._windows = {}
+        
+        # Centered time ramps for linear detrending, keyed by signal length
+        self._trend_bases = {}
+        
         # Detection thresholds
         self.breathing_threshold = 0.1
         self.heartbeat_threshold = 0.05
         
     def _init_filters(self):
-        """Initialize digital filters for signal processing"""
+        """
+        Initialize digital filters for signal processing
+        Coefficients are float32 so filtering stays in single precision
+        """
         # Bandpass for breathing
         self.breathing_sos = signal.butter(
             4, self.breathing_range, btype='band', 
             fs=self.fs, output='sos'
-        )
+        ).astype(np.float32)
         
         # Bandpass for heartbeat
         self.heartbeat_sos = signal.butter(
             4, self.heartbeat_range, btype='band', 
             fs=self.fs, output='sos'
-        )
+        ).astype(np.float32)
         
         # Notch filter for powerline interference (50/60 Hz)
         b, a = signal.iirnotch(50, 30, self.fs)  # Remove 50 Hz interference
-        self.notch_sos = signal.tf2sos(b, a)
+        self.notch_sos = signal.tf2sos(b, a).astype(np.float32)
     
     def process_iq_data(self, iq_data: np.ndarray) -> Dict:
         """
@@ -57,17 +86,19 @@ class MMWaveProcessor:
         # 2. Extract phase information (vital signs are in phase variations)
         phase_signal = self._extract_phase(cleaned_iq)
         
-        # 3. Apply vital sign filters
-        breathing_signal = signal.sosfilt(self.breathing_sos, phase_signal)
-        heartbeat_signal = signal.sosfilt(self.heartbeat_sos, phase_signal)
+        # 3. Apply vital sign filters (rows: breathing, heartbeat)
+        band_signals = np.stack([
+            signal.sosfilt(self.breathing_sos, phase_signal),
+            signal.sosfilt(self.heartbeat_sos, phase_signal)
+        ])
         
-        # 4. Remove DC offset and trends
-        breathing_signal = signal.detrend(breathing_signal)
-        heartbeat_signal = signal.detrend(heartbeat_signal)
+        # 4. Remove DC offset and trends (both bands in one pass)
+        self._detrend(band_signals)
+        breathing_signal, heartbeat_signal = band_signals
         
-        # 5. Frequency domain analysis
-        breathing_fft, breathing_freqs = self._compute_spectrum(breathing_signal)
-        heartbeat_fft, heartbeat_freqs = self._compute_spectrum(heartbeat_signal)
+        # 5. Frequency domain analysis (both bands in one batched FFT)
+        (breathing_fft, heartbeat_fft), freqs = self._compute_spectra(band_signals)
+        breathing_freqs = heartbeat_freqs = freqs
         
         # 6. Peak detection in frequency domain
         vital_signs = self._detect_vital_signs(
@@ -95,50 +126,85 @@ class MMWaveProcessor:
     
     def _preprocess_iq(self, iq_data: np.ndarray) -> np.ndarray:
         """Preprocess I/Q data: filtering, normalization"""
-        # Convert to numpy array if needed
-        iq_array = np.array(iq_data, dtype=complex)
+        # Convert to single-precision numpy array (always a copy, so it can be
+        # modified in place); complex64 is ample for phase-based vital signs
+        iq_array = np.array(iq_data, dtype=np.complex64)
         
         # Remove DC offset
-        iq_centered = iq_array - np.mean(iq_array)
+        iq_array -= iq_array.mean()
         
         # Apply notch filter to remove interference
-        iq_filtered = signal.sosfilt(self.notch_sos, iq_centered)
+        iq_filtered = signal.sosfilt(self.notch_sos, iq_array)
         
-        # Normalize amplitude
-        iq_normalized = iq_filtered / np.max(np.abs(iq_filtered)) if np.max(np.abs(iq_filtered)) > 0 else iq_filtered
+        # Normalize amplitude (single pass for the peak, in-place divide)
+        peak = np.abs(iq_filtered).max()
+        if peak > 0:
+            iq_filtered /= peak
         
-        return iq_normalized
+        return iq_filtered
     
     def _extract_phase(self, iq_data: np.ndarray) -> np.ndarray:
         """
         Extract phase information from I/Q data
         Vital signs cause tiny phase variations in radar signal
         """
-        # Phase = arctan(Q/I)
-        phase = np.unwrap(np.angle(iq_data))
+        # Accumulate sample-to-sample phase increments: angle(z[n] * conj(z[n-1]))
+        # is wrap-free, so this equals the unwrapped phase up to a constant
+        # offset (removed by the detrend) without a separate unwrap pass
+        iq_data = np.asarray(iq_data)
+        phase = np.zeros(len(iq_data), dtype=iq_data.real.dtype)
+        if len(iq_data) > 1:
+            np.cumsum(np.angle(iq_data[1:] * np.conj(iq_data[:-1])), out=phase[1:])
         
         # Remove linear trend (range information)
-        phase_detrended = signal.detrend(phase)
-        
-        return phase_detrended
+        return self._detrend(phase)
+    
+    def _detrend(self, data: np.ndarray) -> np.ndarray:
+        """
+        Remove the least-squares linear trend along the last axis, in place
+        Closed-form fit against a cached centered time ramp; equivalent to signal.detrend
+        """
+        n = data.shape[-1]
+        basis = self._trend_bases.get(n)
+        if basis is None:
+            t = np.arange(n, dtype=np.float64)
+            t -= t.mean()
+            basis = self._trend_bases[n] = (t.astype(np.float32),
+                                            (t / max(np.dot(t, t), 1.0)).astype(np.float32))
+        t, slope_weights = basis
+        
+        # The ramp has zero mean, so the slope is unaffected by the offset
+        slope = data @ slope_weights
+        data -= data.mean(axis=-1, keepdims=True)
+        data -= np.expand_dims(slope, -1) * t
+        return data
     
     def _compute_spectrum(self, signal_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Compute power spectrum using FFT"""
+        power_spectra, freqs = self._compute_spectra(signal_data[np.newaxis, :])
+        return power_spectra[0], freqs
+    
+    def _compute_spectra(self, signals: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute power spectra of equal-length real signals stacked as rows of an (S, N) array
+        All rows are transformed in a single multi-threaded FFT call
+        """
         # Apply window function to reduce spectral leakage
-        window = np.hanning(len(signal_data))
-        windowed_signal = signal_data * window
+        n = signals.shape[-1]
+        window = self._windows.get(n)
+        if window is None:
+            window = self._windows[n] = np.hanning(n).astype(np.float32)
+        windowed_signals = signals * window
         
-        # Compute FFT
-        n = len(windowed_signal)
-        fft_result = fft(windowed_signal, n=self.fft_size)
+        # Compute FFT of the real input (the windowed copy is scratch space)
+        fft_result = _rfft(windowed_signals, n=self.fft_size, axis=-1,
+                           overwrite_x=True, workers=-1)
         
         # Compute power spectrum (magnitude squared)
-        power_spectrum = np.abs(fft_result[:self.fft_size//2]) ** 2
-        
-        # Frequency bins
-        freqs = fftfreq(self.fft_size, 1/self.fs)[:self.fft_size//2]
+        power_spectra = np.abs(fft_result[:, :self.fft_size//2])
+        power_spectra **= 2
         
-        return power_spectrum, freqs
+        return power_spectra, self._spectrum_freqs
     
     def _detect_vital_signs(self, breathing_spectrum, breathing_freqs,
                            heartbeat_spectrum, heartbeat_freqs) -> Dict:
@@ -193,8 +259,8 @@ class MMWaveProcessor:
         return {
             'breathing_rate_bpm': round(breathing_bpm, 1),
             'heart_rate_bpm': round(heartbeat_bpm, 1),
-            'breathing_confidence': round(breathing_confidence, 2),
-            'heartbeat_confidence': round(heartbeat_confidence, 2),
+            'breathing_confidence': round(float(breathing_confidence), 2),
+            'heartbeat_confidence': round(float(heartbeat_confidence), 2),
             'vital_signs_detected': vital_signs_detected,
             'occupant_type': occupant_type,
             'type_confidence': round(type_confidence, 2),
@@ -228,12 +294,12 @@ class MMWaveProcessor:
         if len(signal_data) == 0:
             return 0
         
-        # Simple SNR estimation
+        # Simple SNR estimation: noise is the residual from a 5-tap moving average
         signal_power = np.mean(signal_data ** 2)
-        noise_power = np.var(signal_data - signal.medfilt(signal_data, 5))
+        noise_power = np.var(signal_data - uniform_filter1d(signal_data, size=5))
         
         if noise_power > 0:
-            snr = 10 * np.log10(signal_power / noise_power)
+            snr = 10 * np.log10(float(signal_power) / float(noise_power))
             return max(snr, 0)
         return 0
     
@@ -244,7 +310,14 @@ class MMWaveProcessor:
         
         normalized_spectrum = spectrum / np.sum(spectrum)
         # Entropy measure (lower entropy = purer spectrum)
-        entropy = -np.sum(normalized_spectrum * np.log2(normalized_spectrum + 1e-10))
+        if ne is not None:
+            entropy = -float(ne.evaluate(
+                "sum(p * log(p + 1e-10))", local_dict={'p': normalized_spectrum}
+            )) / np.log(2)
+        else:
+            log_p = normalized_spectrum + 1e-10
+            np.log2(log_p, out=log_p)
+            entropy = -np.dot(normalized_spectrum, log_p)
         max_entropy = np.log2(len(spectrum))
         
         purity = 1 - (entropy / max_entropy)
@@ -269,43 +342,59 @@ class MMWaveProcessor:
                                 'medium' if movement_index > 0.1 else 'low'
         }
     
-    def batch_process_dataset(self, dataset_path):
-        """Process entire dataset and generate analysis"""
+    def batch_process_dataset(self, dataset_path, max_workers=None):
+        """
+        Process entire dataset and generate analysis
+        Scenarios are independent, so they are processed in parallel worker processes
+        """
         with open(dataset_path, 'r') as f:
             dataset = json.load(f)
         
-        results = []
-        
         print(f"Processing {len(dataset['scenarios'])} scenarios...")
         
+        # Load I/Q data for every scenario that has it
+        scenarios = []
+        iq_signals = []
         for scenario in dataset['scenarios']:
-            # Load I/Q data if available
-            iq_file = f"data/raw/mmwave/{scenario['scenario_id']}_iq.json"
-            if os.path.exists(iq_file):
-                with open(iq_file, 'r') as f:
+            iq_file = f"data/raw/mmwave/{scenario['scenario_id']}_iq"
+            if os.path.exists(iq_file + '.npz'):
+                with np.load(iq_file + '.npz') as iq_data:
+                    iq_real = iq_data['iq_real']
+                    iq_imag = iq_data['iq_imag']
+            elif os.path.exists(iq_file + '.json'):
+                # Datasets generated before the switch to .npz
+                with open(iq_file + '.json', 'r') as f:
                     iq_data = json.load(f)
-                
-                # Reconstruct complex I/Q data
                 iq_real = np.array(iq_data['iq_real'])
                 iq_imag = np.array(iq_data['iq_imag'])
-                iq_complex = iq_real + 1j * iq_imag
-                
-                # Process the data
-                processing_result = self.process_iq_data(iq_complex)
-                
-                # Combine with scenario data
-                result = {
-                    'scenario_id': scenario['scenario_id'],
-                    'ground_truth': {
-                        'has_child': scenario['has_child'],
-                        'movement_level': scenario['movement_level']
-                    },
-                    'processing_result': processing_result,
-                    'car_sensors': scenario['car_sensors'],
-                    'timestamp': scenario['timestamp']
-                }
-                
-                results.append(result)
+            else:
+                continue
+            
+            # Reconstruct complex I/Q data
+            scenarios.append(scenario)
+            iq_signals.append(iq_real + 1j * iq_imag)
+        
+        # Process the data
+        if len(iq_signals) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                processing_results = list(executor.map(self.process_iq_data, iq_signals))
+        else:
+            processing_results = [self.process_iq_data(iq) for iq in iq_signals]
+        
+        # Combine with scenario data
+        results = [
+            {
+                'scenario_id': scenario['scenario_id'],
+                'ground_truth': {
+                    'has_child': scenario['has_child'],
+                    'movement_level': scenario['movement_level']
+                },
+                'processing_result': processing_result,
+                'car_sensors': scenario['car_sensors'],
+                'timestamp': scenario['timestamp']
+            }
+            for scenario, processing_result in zip(scenarios, processing_results)
+        ]
         
         # Save processing results
         output_path = dataset_path.replace('.json', '_processed.json')
@@ -324,64 +413,76 @@ class MMWaveProcessor:
         print(f"Processing complete. Results saved to {output_path}")
         return results
     
+    # (title, x label, y label) for each panel of the processing figure, row-major
+    _PANEL_LABELS = [
+        ('Raw Radar Signal (Amplitude)', 'Time (s)', 'Amplitude'),
+        ('Extracted Phase (Vital Signs)', 'Time (s)', 'Phase (rad)'),
+        ('Filtered Breathing Signal', 'Time (s)', 'Amplitude'),
+        ('Filtered Heartbeat Signal', 'Time (s)', 'Amplitude'),
+        ('Breathing Spectrum', 'Frequency (Hz)', 'Power'),
+        ('Heartbeat Spectrum', 'Frequency (Hz)', 'Power'),
+    ]
+    
+    def _init_figure(self):
+        """
+        Build the processing figure once; later calls only update line data
+        Uses a pyplot-free Figure, which renders with Agg and never opens a window
+        """
+        fig = Figure(figsize=(12, 10))
+        axes = fig.subplots(3, 2)
+        
+        for ax, (title, xlabel, ylabel) in zip(axes.flat, self._PANEL_LABELS):
+            ax.set_title(title)
+            ax.set_xlabel(xlabel)
+            ax.set_ylabel(ylabel)
+            ax.grid(True)
+        
+        self._lines = [ax.plot([], [])[0] for ax in axes.flat]
+        self._vital_text = fig.text(0.5, 0.01, '', ha='center', fontsize=10,
+                                    bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray"))
+        fig.tight_layout(rect=[0, 0.05, 1, 0.95])
+        self._fig, self._axes = fig, axes
+    
+    def __getstate__(self):
+        """Leave the cached figure behind when pickling (e.g. for worker processes)"""
+        state = self.__dict__.copy()
+        for key in ('_fig', '_axes', '_lines', '_vital_text'):
+            state.pop(key, None)
+        return state
+    
     def visualize_processing(self, iq_data, save_path=None):
         """Create visualization of signal processing pipeline"""
         # Process data
         result = self.process_iq_data(iq_data)
         
-        # Create figure with subplots
-        fig, axes = plt.subplots(3, 2, figsize=(12, 10))
+        if getattr(self, '_fig', None) is None:
+            self._init_figure()
         
-        # Time: Raw I/Q amplitude
+        # Time: raw amplitude, extracted phase, filtered breathing/heartbeat
         time_axis = np.arange(len(iq_data)) / self.fs
-        axes[0, 0].plot(time_axis, np.abs(iq_data))
-        axes[0, 0].set_title('Raw Radar Signal (Amplitude)')
-        axes[0, 0].set_xlabel('Time (s)')
-        axes[0, 0].set_ylabel('Amplitude')
-        axes[0, 0].grid(True)
-        
-        # Time: Extracted phase
         phase = self._extract_phase(iq_data)
-        axes[0, 1].plot(time_axis[:len(phase)], phase)
-        axes[0, 1].set_title('Extracted Phase (Vital Signs)')
-        axes[0, 1].set_xlabel('Time (s)')
-        axes[0, 1].set_ylabel('Phase (rad)')
-        axes[0, 1].grid(True)
-        
-        # Time: Filtered breathing signal
         breathing_signal = signal.sosfilt(self.breathing_sos, phase)
-        axes[1, 0].plot(time_axis[:len(breathing_signal)], breathing_signal)
-        axes[1, 0].set_title('Filtered Breathing Signal')
-        axes[1, 0].set_xlabel('Time (s)')
-        axes[1, 0].set_ylabel('Amplitude')
-        axes[1, 0].grid(True)
-        
-        # Time: Filtered heartbeat signal
         heartbeat_signal = signal.sosfilt(self.heartbeat_sos, phase)
-        axes[1, 1].plot(time_axis[:len(heartbeat_signal)], heartbeat_signal)
-        axes[1, 1].set_title('Filtered Heartbeat Signal')
-        axes[1, 1].set_xlabel('Time (s)')
-        axes[1, 1].set_ylabel('Amplitude')
-        axes[1, 1].grid(True)
         
-        # Frequency: Breathing spectrum
+        # Frequency: breathing/heartbeat spectra
         breathing_fft, breathing_freqs = self._compute_spectrum(breathing_signal)
-        axes[2, 0].plot(breathing_freqs, breathing_fft)
-        axes[2, 0].set_title('Breathing Spectrum')
-        axes[2, 0].set_xlabel('Frequency (Hz)')
-        axes[2, 0].set_ylabel('Power')
-        axes[2, 0].grid(True)
-        
-        # Frequency: Heartbeat spectrum
         heartbeat_fft, heartbeat_freqs = self._compute_spectrum(heartbeat_signal)
-        axes[2, 1].plot(heartbeat_freqs, heartbeat_fft)
-        axes[2, 1].set_title('Heartbeat Spectrum')
-        axes[2, 1].set_xlabel('Frequency (Hz)')
-        axes[2, 1].set_ylabel('Power')
-        axes[2, 1].grid(True)
+        
+        panel_data = [
+            (time_axis, np.abs(iq_data)),
+            (time_axis[:len(phase)], phase),
+            (time_axis[:len(breathing_signal)], breathing_signal),
+            (time_axis[:len(heartbeat_signal)], heartbeat_signal),
+            (breathing_freqs, breathing_fft),
+            (heartbeat_freqs, heartbeat_fft),
+        ]
+        for ax, line, (x, y) in zip(self._axes.flat, self._lines, panel_data):
+            line.set_data(x, y)
+            ax.relim()
+            ax.autoscale_view()
         
         # Add vital signs text
-        vital_text = (
+        self._vital_text.set_text(
             f"Breathing: {result['vital_signs']['breathing_rate_bpm']} BPM "
             f"(conf: {result['vital_signs']['breathing_confidence']:.2f})\n"
             f"Heartbeat: {result['vital_signs']['heart_rate_bpm']} BPM "
@@ -389,17 +490,12 @@ class MMWaveProcessor:
             f"Occupant: {result['vital_signs']['occupant_type']} "
             f"(conf: {result['vital_signs']['type_confidence']:.2f})"
         )
-        plt.figtext(0.5, 0.01, vital_text, ha='center', fontsize=10, 
-                   bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray"))
-        
-        plt.tight_layout(rect=[0, 0.05, 1, 0.95])
         
         if save_path:
-            plt.savefig(save_path, dpi=150, bbox_inches='tight')
+            self._fig.savefig(save_path, dpi=150, bbox_inches='tight')
             print(f"Visualization saved to {save_path}")
         
-        plt.show()
-        return fig
+        return self._fig
 
 # Main processing script
 if __name__ == "__main__":
@@ -412,7 +508,7 @@ if __name__ == "__main__":
     # Generate test data
     from utils.mmwave_simulator import MMWaveSimulator
     simulator = MMWaveSimulator(sampling_rate=100, duration=30)
-    iq_data = simulator.generate_mmwave_iq_data(has_child=True, movement_level='low')
+    iq_data = simulator.generate_mmwave_iq_data(has_child=True, movement_level='low', dtype=np.complex64)
     
     # Process the data
     print("\n1. Processing mmWave radar data...")
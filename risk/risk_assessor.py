@@ -1,9 +1,408 @@
 import numpy as np
-import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-import json
-from scipy import stats
+import orjson
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from collections.abc import Mapping
+from functools import lru_cache, partial
+from types import FunctionType, MappingProxyType
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Risk thresholds, shared with the compiled kernel below
+TEMP_DANGER = 40.0   # °C - Immediate danger
+TEMP_WARNING = 26.0  # °C - Warning level
+TIME_CRITICAL = 30   # minutes - Critical time
+TIME_WARNING = 10    # minutes - Warning time
+
+# Vital sign thresholds
+CHILD_HR_MIN = 80    # BPM - Minimum child heart rate
+CHILD_HR_MAX = 120   # BPM - Maximum child heart rate
+ADULT_HR_MIN = 60    # BPM - Minimum adult heart rate
+ADULT_HR_MAX = 100   # BPM - Maximum adult heart rate
+
+# Risk weights (sum to 1.0), in component order:
+# temperature, time elapsed, vital signs, environmental, vehicle state
+_WEIGHTS = (0.25, 0.20, 0.25, 0.15, 0.15)
+_WEIGHTS_ARR = np.array(_WEIGHTS)
+
+# Normal patterns for anomaly detection
+# These would normally be trained on historical data
+_NORMAL_PATTERNS = {
+    'child_hr_mean': 100,  # Average child heart rate
+    'child_hr_std': 10,    # Standard deviation
+    'child_br_mean': 25,   # Average child breathing rate
+    'child_br_std': 5,
+    'car_temp_rise_rate': 0.5,  # °C per minute in hot car
+}
+
+# Risk levels, lowest first; each starts 0.2 above the previous one
+_LEVEL_NAMES = ("SAFE", "LOW", "MODERATE", "HIGH", "CRITICAL")
+
+# Recommended actions per risk level
+_ACTIONS = {
+    "CRITICAL": (
+        "IMMEDIATE: Contact emergency services (911)",
+        "Alert vehicle owner with emergency notification",
+        "Activate vehicle horn and lights",
+        "If possible, remotely activate climate control",
+        "Dispatch security/law enforcement to location"
+    ),
+    "HIGH": (
+        "URGENT: Send emergency alert to vehicle owner",
+        "Activate vehicle alarm system",
+        "Send notification to backup contacts",
+        "Monitor vital signs continuously",
+        "Prepare emergency services dispatch"
+    ),
+    "MODERATE": (
+        "WARNING: Send alert to vehicle owner",
+        "Check if this is a false positive",
+        "Monitor situation for 5 minutes",
+        "Alert backup contact",
+        "Record all sensor data for analysis"
+    ),
+    "LOW": (
+        "NOTIFICATION: Send informational alert",
+        "Monitor for changes",
+        "Check environmental conditions",
+        "Update risk assessment in 2 minutes"
+    ),
+    "SAFE": (
+        "Continue routine monitoring",
+        "Log normal conditions",
+        "Update dashboard status"
+    )
+}
+_ACTIONS_LUT = tuple(_ACTIONS[level] for level in _LEVEL_NAMES)
+
+# Available report export formats
+_EXPORT_FORMATS = ('json', 'csv', 'pdf')
+
+# Shared read-only stand-in for missing radar sub-dicts
+_EMPTY = MappingProxyType({})
+
+# Weather encoded at ingestion so the kernel never touches strings
+WEATHER_OTHER = 0
+WEATHER_SUNNY = 1
+
+
+def _weather_code(weather: str) -> int:
+    """Encode a weather description for _compute_total_risk"""
+    weather = weather.lower()
+    if 'clear' in weather or 'sunny' in weather:
+        return WEATHER_SUNNY
+    return WEATHER_OTHER
+
+
+def _q(x: float) -> float:
+    """Quantize a non-negative score to 3 decimals for the result dict"""
+    return int(x * 1000 + 0.5) / 1000.0
+
+
+def _compute_total_risk(temp, time_min, vital_detected, hr, br, hb_conf, br_conf,
+                        outdoor_t, humidity, weather_code, hour, engine_off, door_closed):
+    """Risk components and weighted total: (temperature, time, vital, env, vehicle, total)"""
+
+    # 1. Temperature, linear from warning to danger
+    if temp >= TEMP_DANGER:
+        temp_risk = 1.0
+    elif temp >= TEMP_WARNING:
+        temp_risk = (temp - TEMP_WARNING) / (TEMP_DANGER - TEMP_WARNING)
+    else:
+        temp_risk = 0.0
+
+    # 2. Time elapsed
+    if time_min >= TIME_CRITICAL:
+        time_risk = 1.0
+    elif time_min >= TIME_WARNING:
+        time_risk = (time_min - TIME_WARNING) / (TIME_CRITICAL - TIME_WARNING)
+    else:
+        time_risk = 0.0
+
+    # 3. Vital signs
+    vital_risk = 0.0
+    if vital_detected:
+        if CHILD_HR_MIN <= hr <= CHILD_HR_MAX:
+            if hb_conf < 0.5:
+                vital_risk += 0.3
+        elif hr > 0:
+            vital_risk += 0.2
+        if 20 <= br <= 30:
+            if br_conf < 0.5:
+                vital_risk += 0.2
+        elif br > 0:
+            vital_risk += 0.1
+        vital_risk += (1 - (hb_conf + br_conf) / 2) * 0.5
+        vital_risk = min(vital_risk, 1.0)
+
+    # 4. Environment
+    env_risk = 0.0
+    if outdoor_t > 30:
+        env_risk += 0.3
+    elif outdoor_t > 25:
+        env_risk += 0.1
+    if humidity > 70:
+        env_risk += 0.2
+    if weather_code == WEATHER_SUNNY:
+        env_risk += 0.2
+    if 12 <= hour <= 16:
+        env_risk += 0.2
+    env_risk = min(env_risk, 1.0)
+
+    # 5. Vehicle state
+    vehicle_risk = 0.0
+    if engine_off:
+        vehicle_risk += 0.4
+    if door_closed:
+        vehicle_risk += 0.4
+    if engine_off and door_closed:
+        vehicle_risk += 0.2
+    vehicle_risk = min(vehicle_risk, 1.0)
+
+    total = (temp_risk * _WEIGHTS[0] + time_risk * _WEIGHTS[1] + vital_risk * _WEIGHTS[2] +
+             env_risk * _WEIGHTS[3] + vehicle_risk * _WEIGHTS[4])
+    total = 0.0 if total < 0.0 else (1.0 if total > 1.0 else total)
+
+    return temp_risk, time_risk, vital_risk, env_risk, vehicle_risk, total
+
+
+_KERNEL_SIGNATURE = "UniTuple(f8, 6)(f8, f8, b1, f8, f8, f8, f8, f8, f8, i8, i8, b1, b1)"
+_kernel_py_func = _compute_total_risk
+
+if _NUMBA_AVAILABLE:
+    _compute_total_risk = njit(_KERNEL_SIGNATURE, cache=True)(_compute_total_risk)
+
+# Thresholds a deployment may override through RadarRiskAssessor.compile
+_CONFIG_KEYS = (
+    'TEMP_DANGER', 'TEMP_WARNING', 'TIME_CRITICAL', 'TIME_WARNING',
+    'CHILD_HR_MIN', 'CHILD_HR_MAX', 'weights'
+)
+_WEIGHT_NAMES = ('temperature', 'time_elapsed', 'vital_signs', 'environmental', 'vehicle_state')
+
+
+@lru_cache(maxsize=256)
+def _assess_quantized(kernel, temp_q, time_q, vital_detected, hr_q, br_q, hb_conf_q, br_conf_q,
+                      outdoor_q, humidity_q, weather_code, hour, engine_off, door_closed):
+    """`kernel` memoised on bucketed inputs (see RiskInputs.quantized)"""
+    return kernel(temp_q, time_q, vital_detected, hr_q, br_q, hb_conf_q, br_conf_q,
+                  outdoor_q, humidity_q, weather_code, hour, engine_off, door_closed)
+
+
+@dataclass(frozen=True)
+class RiskInputs:
+    """Scalar inputs of one assessment, normalised once from the raw dicts"""
+    __slots__ = (
+        'temperature_c', 'time_elapsed_min', 'vital_signs_detected',
+        'heart_rate_bpm', 'breathing_rate_bpm', 'heartbeat_confidence',
+        'breathing_confidence', 'outdoor_temperature_c', 'humidity',
+        'weather_code', 'engine_off', 'door_closed'
+    )
+
+    temperature_c: float
+    time_elapsed_min: float
+    vital_signs_detected: bool
+    heart_rate_bpm: float
+    breathing_rate_bpm: float
+    heartbeat_confidence: float
+    breathing_confidence: float
+    outdoor_temperature_c: float
+    humidity: float
+    weather_code: int
+    engine_off: bool
+    door_closed: bool
+
+    def quantized(self) -> Tuple:
+        """
+        Hashable key with slow-changing readings bucketed: 0.5 °C, 30 s,
+        1 BPM, 0.05 confidence and 1 % humidity
+        """
+        return (
+            round(self.temperature_c * 2) / 2,
+            round(self.time_elapsed_min * 2) / 2,
+            self.vital_signs_detected,
+            float(round(self.heart_rate_bpm)),
+            float(round(self.breathing_rate_bpm)),
+            round(self.heartbeat_confidence * 20) / 20,
+            round(self.breathing_confidence * 20) / 20,
+            round(self.outdoor_temperature_c * 2) / 2,
+            float(round(self.humidity)),
+            self.weather_code,
+            self.engine_off,
+            self.door_closed
+        )
+
+    @classmethod
+    def from_dicts(cls, radar_data: Dict, car_sensors: Dict,
+                   environmental: Dict, time_elapsed_min: float) -> 'RiskInputs':
+        """Apply the assess_risk defaults to the raw sensor dicts"""
+        vital_signs = radar_data.get('vital_signs') or _EMPTY
+        return cls(
+            float(car_sensors.get('temperature_c', 25)),
+            float(time_elapsed_min),
+            bool(vital_signs.get('vital_signs_detected', False)),
+            float(vital_signs.get('heart_rate_bpm', 0)),
+            float(vital_signs.get('breathing_rate_bpm', 0)),
+            float(vital_signs.get('heartbeat_confidence', 0)),
+            float(vital_signs.get('breathing_confidence', 0)),
+            float(environmental.get('temperature_c', 25)),
+            float(environmental.get('humidity', 50)),
+            _weather_code(environmental.get('weather', '')),
+            car_sensors.get('engine_state') == 'off',
+            car_sensors.get('door_state') == 'closed'
+        )
+
+
+@dataclass(frozen=True)
+class RiskInputsBatch:
+    """RiskInputs for N vehicles stored column-wise, one 1D array per field"""
+    __slots__ = RiskInputs.__slots__
+
+    temperature_c: np.ndarray
+    time_elapsed_min: np.ndarray
+    vital_signs_detected: np.ndarray
+    heart_rate_bpm: np.ndarray
+    breathing_rate_bpm: np.ndarray
+    heartbeat_confidence: np.ndarray
+    breathing_confidence: np.ndarray
+    outdoor_temperature_c: np.ndarray
+    humidity: np.ndarray
+    weather_code: np.ndarray
+    engine_off: np.ndarray
+    door_closed: np.ndarray
+
+    @classmethod
+    def from_inputs(cls, inputs: Sequence[RiskInputs]) -> 'RiskInputsBatch':
+        """Transpose a sequence of RiskInputs into columns"""
+        return cls(*(np.array([getattr(item, name) for item in inputs]) for name in RiskInputs.__slots__))
+
+    @classmethod
+    def from_frame(cls, frame) -> 'RiskInputsBatch':
+        """
+        Build from a DataFrame (or dict of arrays) with one row per vehicle
+
+        Columns are named like the RiskInputs fields, except that weather,
+        engine_state and door_state hold the raw strings. Missing columns
+        take the assess_risk defaults.
+        """
+        n = len(frame[next(iter(frame))])
+
+        def column(name, default, dtype=np.float64):
+            if name in frame:
+                return np.asarray(frame[name], dtype=dtype)
+            return np.full(n, default, dtype=dtype)
+
+        weather = np.char.lower(np.asarray(frame['weather'], dtype=str)) \
+            if 'weather' in frame else np.full(n, '')
+        sunny = (np.char.find(weather, 'clear') >= 0) | (np.char.find(weather, 'sunny') >= 0)
+
+        return cls(
+            column('temperature_c', 25),
+            column('time_elapsed_min', 0),
+            column('vital_signs_detected', False, bool),
+            column('heart_rate_bpm', 0),
+            column('breathing_rate_bpm', 0),
+            column('heartbeat_confidence', 0),
+            column('breathing_confidence', 0),
+            column('outdoor_temperature_c', 25),
+            column('humidity', 50),
+            np.where(sunny, WEATHER_SUNNY, WEATHER_OTHER),
+            column('engine_state', '', object) == 'off',
+            column('door_state', '', object) == 'closed'
+        )
+
+
+class RiskResult(dict):
+    """
+    Result of RadarRiskAssessor.assess_risk
+
+    A plain dict with the usual eight keys, except that the human-readable
+    assessment_summary is only formatted the first time it is needed.
+    Looking up the other keys leaves it unformatted; reading it, or
+    anything that walks the whole dict (iteration, items(), ==, dict(result),
+    json.dumps), formats it first.
+    """
+    __slots__ = ('_summary_factory',)
+
+    def __init__(self, risk_components: Dict, total_risk: float, risk_level: str,
+                 confidence: float, anomalies_detected: List[Dict],
+                 recommended_actions: List[str], timestamp: str, summary_factory):
+        super().__init__(
+            risk_components=risk_components,
+            total_risk=total_risk,
+            risk_level=risk_level,
+            confidence=confidence,
+            anomalies_detected=anomalies_detected,
+            recommended_actions=recommended_actions,
+            timestamp=timestamp
+        )
+        self._summary_factory = summary_factory
+
+    def _complete(self) -> 'RiskResult':
+        """Format assessment_summary if it hasn't been yet"""
+        if self._summary_factory is not None:
+            factory, self._summary_factory = self._summary_factory, None
+            dict.__setitem__(self, 'assessment_summary', factory())
+        return self
+
+    def __missing__(self, key):
+        if key == 'assessment_summary' and self._summary_factory is not None:
+            return self._complete()[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'assessment_summary':
+            self._complete()
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        return (key == 'assessment_summary' and self._summary_factory is not None) or \
+            dict.__contains__(self, key)
+
+    def __len__(self):
+        return dict.__len__(self) + (self._summary_factory is not None)
+
+    def __iter__(self):
+        return dict.__iter__(self._complete())
+
+    def keys(self):
+        return dict.keys(self._complete())
+
+    def values(self):
+        return dict.values(self._complete())
+
+    def items(self):
+        return dict.items(self._complete())
+
+    def copy(self) -> Dict:
+        return dict.copy(self._complete())
+
+    def __eq__(self, other):
+        return dict.__eq__(self._complete(), other)
+
+    def __ne__(self, other):
+        return dict.__ne__(self._complete(), other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return dict.__repr__(self._complete())
+
+    def __reduce__(self):
+        # Unpickles as a plain dict with the summary already formatted
+        return dict, (dict.copy(self._complete()),)
+
+
+def _json_default(obj):
+    """orjson fallback for read-only Mappings such as MappingProxyType"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
 
 class RadarRiskAssessor:
     """
@@ -11,140 +410,279 @@ class RadarRiskAssessor:
     Evaluates child safety risk based on multiple factors
     """
     
-    def __init__(self):
-        # Risk thresholds (configurable)
-        self.TEMP_DANGER = 40.0  # °C - Immediate danger
-        self.TEMP_WARNING = 26.0  # °C - Warning level
-        self.TIME_CRITICAL = 30  # minutes - Critical time
-        self.TIME_WARNING = 10   # minutes - Warning time
-        
-        # Vital sign thresholds
-        self.CHILD_HR_MIN = 80   # BPM - Minimum child heart rate
-        self.CHILD_HR_MAX = 120  # BPM - Maximum child heart rate
-        self.ADULT_HR_MIN = 60   # BPM - Minimum adult heart rate
-        self.ADULT_HR_MAX = 100  # BPM - Maximum adult heart rate
-        
-        # Risk weights (sum to 1.0)
-        self.weights = {
-            'temperature': 0.25,
-            'time_elapsed': 0.20,
-            'vital_signs': 0.25,
-            'environmental': 0.15,
-            'vehicle_state': 0.15
-        }
+    # Thresholds and weights are fixed per deployment; see the module constants
+    TEMP_DANGER = TEMP_DANGER
+    TEMP_WARNING = TEMP_WARNING
+    TIME_CRITICAL = TIME_CRITICAL
+    TIME_WARNING = TIME_WARNING
+    CHILD_HR_MIN = CHILD_HR_MIN
+    CHILD_HR_MAX = CHILD_HR_MAX
+    ADULT_HR_MIN = ADULT_HR_MIN
+    ADULT_HR_MAX = ADULT_HR_MAX
+    
+    weights = MappingProxyType(dict(zip(_WEIGHT_NAMES, _WEIGHTS)))
+    _weights_arr = _WEIGHTS_ARR
+    normal_patterns = MappingProxyType(_NORMAL_PATTERNS)
+    
+    # Risk component kernel; compile() swaps in a specialised copy
+    _kernel = staticmethod(_compute_total_risk)
+    
+    def __init__(self, quantize_inputs: bool = False):
+        # Compiled kernel when numba is installed, Python components otherwise
+        self._use_kernel = _NUMBA_AVAILABLE
         
-        # Load historical patterns for anomaly detection
-        self._load_normal_patterns()
-    
-    def _load_normal_patterns(self):
-        """Load/define normal patterns for anomaly detection"""
-        # These would normally be trained on historical data
-        self.normal_patterns = {
-            'child_hr_mean': 100,  # Average child heart rate
-            'child_hr_std': 10,    # Standard deviation
-            'child_br_mean': 25,   # Average child breathing rate
-            'child_br_std': 5,
-            'car_temp_rise_rate': 0.5,  # °C per minute in hot car
-        }
+        # Steady-state monitoring: bucket the inputs and reuse the components
+        # of recently seen buckets instead of recomputing them every frame
+        self.quantize_inputs = quantize_inputs
+    
+    @classmethod
+    def compile(cls, config: Dict, quantize_inputs: bool = False) -> 'RadarRiskAssessor':
+        """
+        Assessor specialised for one deployment's thresholds and weights
+        
+        `config` may set TEMP_DANGER, TEMP_WARNING, TIME_CRITICAL, TIME_WARNING,
+        CHILD_HR_MIN, CHILD_HR_MAX and 'weights' (five floats in component
+        order). The risk kernel is rebuilt with these values as its globals,
+        so Numba folds them into the compiled code as constants; anomaly
+        detection and the batch path read them from the instance.
+        """
+        unknown = set(config) - set(_CONFIG_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown config keys: {sorted(unknown)}")
+        
+        overrides = {key: float(value) for key, value in config.items() if key != 'weights'}
+        weights = _WEIGHTS
+        if 'weights' in config:
+            weights = tuple(float(w) for w in config['weights'])
+            if len(weights) != len(_WEIGHTS):
+                raise ValueError(f"Expected {len(_WEIGHTS)} weights, got {len(weights)}")
+        
+        kernel = FunctionType(
+            _kernel_py_func.__code__,
+            {**_kernel_py_func.__globals__, **overrides, '_WEIGHTS': weights},
+            _kernel_py_func.__name__
+        )
+        if _NUMBA_AVAILABLE:
+            # No on-disk cache: it is keyed by source location, not globals
+            kernel = njit(_KERNEL_SIGNATURE)(kernel)
+        
+        assessor = cls(quantize_inputs=quantize_inputs)
+        assessor._kernel = kernel
+        assessor._use_kernel = True
+        for key, value in overrides.items():
+            setattr(assessor, key, value)
+        assessor.weights = MappingProxyType(dict(zip(_WEIGHT_NAMES, weights)))
+        assessor._weights_arr = np.array(weights)
+        return assessor
     
     def assess_risk(self, radar_data: Dict, car_sensors: Dict, 
-                   environmental: Dict, time_elapsed_min: float) -> Dict:
+                   environmental: Dict, time_elapsed_min: float,
+                   now: Optional[datetime] = None) -> RiskResult:
         """
         Comprehensive risk assessment combining all data sources
         
+        `now` is the assessment time; the clock is read once if omitted.
+        
         Returns:
-            Dictionary with risk scores, assessment, and recommendations
+            RiskResult with risk scores, assessment, and recommendations
         """
         
-        # Calculate individual risk components
-        temp_risk = self._temperature_risk(car_sensors.get('temperature_c', 25))
-        time_risk = self._time_risk(time_elapsed_min)
-        vital_risk = self._vital_signs_risk(radar_data.get('vital_signs', {}))
-        env_risk = self._environmental_risk(environmental)
-        vehicle_risk = self._vehicle_state_risk(car_sensors)
-        
-        # Weighted total risk
-        total_risk = (
-            temp_risk * self.weights['temperature'] +
-            time_risk * self.weights['time_elapsed'] +
-            vital_risk * self.weights['vital_signs'] +
-            env_risk * self.weights['environmental'] +
-            vehicle_risk * self.weights['vehicle_state']
-        )
+        if now is None:
+            now = datetime.now()
+        vital_signs = radar_data.get('vital_signs') or _EMPTY
+        quality = radar_data.get('quality_metrics') or _EMPTY
+        motion = radar_data.get('motion_artifact') or _EMPTY
+        inputs = RiskInputs.from_dicts(radar_data, car_sensors, environmental, time_elapsed_min)
         
-        # Clamp to [0, 1]
-        total_risk = max(0, min(1, total_risk))
+        if self.quantize_inputs:
+            # Same (temp, time, vitals, environment, hour, state) bucket as a
+            # recent frame: reuse its components
+            key = inputs.quantized()
+            temp_risk, time_risk, vital_risk, env_risk, vehicle_risk, total_risk = _assess_quantized(
+                self._kernel, *key[:10], now.hour, *key[10:]
+            )
+        elif self._use_kernel:
+            temp_risk, time_risk, vital_risk, env_risk, vehicle_risk, total_risk = self._kernel(
+                inputs.temperature_c,
+                inputs.time_elapsed_min,
+                inputs.vital_signs_detected,
+                inputs.heart_rate_bpm,
+                inputs.breathing_rate_bpm,
+                inputs.heartbeat_confidence,
+                inputs.breathing_confidence,
+                inputs.outdoor_temperature_c,
+                inputs.humidity,
+                inputs.weather_code,
+                now.hour,
+                inputs.engine_off,
+                inputs.door_closed
+            )
+        else:
+            # Calculate individual risk components
+            temp_risk = self._temperature_risk(inputs.temperature_c)
+            time_risk = self._time_risk(inputs.time_elapsed_min)
+            vital_risk = self._vital_signs_risk(inputs)
+            env_risk = self._environmental_risk(inputs, now.hour)
+            vehicle_risk = self._vehicle_state_risk(inputs)
+            
+            # Weighted total risk, clamped to [0, 1]
+            w_temp, w_time, w_vital, w_env, w_vehicle = _WEIGHTS
+            total_risk = (
+                temp_risk * w_temp +
+                time_risk * w_time +
+                vital_risk * w_vital +
+                env_risk * w_env +
+                vehicle_risk * w_vehicle
+            )
+            total_risk = 0.0 if total_risk < 0.0 else (1.0 if total_risk > 1.0 else total_risk)
         
         # Determine risk level and actions
-        risk_level, actions = self._determine_risk_level(total_risk, {
-            'temperature': car_sensors.get('temperature_c', 25),
-            'time_elapsed': time_elapsed_min,
-            'vital_signs': radar_data.get('vital_signs', {}),
-            'vital_signs_detected': radar_data.get('vital_signs', {}).get('vital_signs_detected', False)
-        })
+        risk_level, actions = self._determine_risk_level(
+            total_risk, inputs.temperature_c, inputs.time_elapsed_min, inputs.vital_signs_detected
+        )
         
         # Anomaly detection
-        anomalies = self._detect_anomalies(radar_data, car_sensors, time_elapsed_min)
+        anomalies = self._detect_anomalies(vital_signs, quality, motion, car_sensors, time_elapsed_min)
         
         # Confidence score (how reliable is our assessment)
-        confidence = self._calculate_confidence(radar_data, car_sensors)
+        confidence = self._calculate_confidence(quality, vital_signs, car_sensors)
         
-        return {
-            'risk_components': {
-                'temperature_risk': round(temp_risk, 3),
-                'time_risk': round(time_risk, 3),
-                'vital_signs_risk': round(vital_risk, 3),
-                'environmental_risk': round(env_risk, 3),
-                'vehicle_state_risk': round(vehicle_risk, 3)
+        return RiskResult(
+            risk_components={
+                'temperature_risk': _q(temp_risk),
+                'time_risk': _q(time_risk),
+                'vital_signs_risk': _q(vital_risk),
+                'environmental_risk': _q(env_risk),
+                'vehicle_state_risk': _q(vehicle_risk)
             },
-            'total_risk': round(total_risk, 3),
-            'risk_level': risk_level,
-            'confidence': round(confidence, 3),
-            'anomalies_detected': anomalies,
-            'recommended_actions': actions,
-            'timestamp': datetime.now().isoformat(),
-            'assessment_summary': self._generate_summary(
-                total_risk, risk_level, radar_data, car_sensors, time_elapsed_min
+            total_risk=_q(total_risk),
+            risk_level=risk_level,
+            confidence=_q(confidence),
+            anomalies_detected=anomalies,
+            recommended_actions=actions,
+            timestamp=now.isoformat(),
+            summary_factory=partial(
+                self._generate_summary,
+                risk_level,
+                car_sensors.get('temperature_c', 25),
+                vital_signs.get('heart_rate_bpm', 'N/A'),
+                time_elapsed_min
             )
+        )
+
+    def assess_risk_batch(self, batch, now: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+        """
+        Vectorized risk components for many vehicles at once
+
+        `batch` is a RiskInputsBatch, or a DataFrame (or dict of arrays) in
+        the layout accepted by RiskInputsBatch.from_frame. `now` sets the
+        time-of-day term and defaults to the current time.
+
+        Returns:
+            Dictionary of arrays: the five component risks and total_risk
+        """
+        if not isinstance(batch, RiskInputsBatch):
+            batch = RiskInputsBatch.from_frame(batch)
+        temperature = batch.temperature_c
+        time_elapsed = batch.time_elapsed_min
+
+        temp_risk = np.clip(
+            (temperature - self.TEMP_WARNING) / (self.TEMP_DANGER - self.TEMP_WARNING), 0.0, 1.0
+        )
+        time_risk = np.clip(
+            (time_elapsed - self.TIME_WARNING) / (self.TIME_CRITICAL - self.TIME_WARNING), 0.0, 1.0
+        )
+
+        # Vital signs: same rules as _vital_signs_risk, as masks
+        detected = batch.vital_signs_detected
+        heart_rate = batch.heart_rate_bpm
+        breathing_rate = batch.breathing_rate_bpm
+        heartbeat_conf = batch.heartbeat_confidence
+        breathing_conf = batch.breathing_confidence
+
+        child_hr = (heart_rate >= self.CHILD_HR_MIN) & (heart_rate <= self.CHILD_HR_MAX)
+        child_br = (breathing_rate >= 20) & (breathing_rate <= 30)
+        vital_risk = (
+            np.where(child_hr, np.where(heartbeat_conf < 0.5, 0.3, 0.0),
+                     np.where(heart_rate > 0, 0.2, 0.0)) +
+            np.where(child_br, np.where(breathing_conf < 0.5, 0.2, 0.0),
+                     np.where(breathing_rate > 0, 0.1, 0.0)) +
+            (1 - (heartbeat_conf + breathing_conf) / 2) * 0.5
+        )
+        vital_risk = np.where(detected, np.minimum(vital_risk, 1.0), 0.0)
+
+        # Environmental conditions
+        outdoor_temp = batch.outdoor_temperature_c
+        humidity = batch.humidity
+        sunny = batch.weather_code == WEATHER_SUNNY
+        hour = (now or datetime.now()).hour
+        env_risk = (
+            np.where(outdoor_temp > 30, 0.3, np.where(outdoor_temp > 25, 0.1, 0.0)) +
+            np.where(humidity > 70, 0.2, 0.0) +
+            np.where(sunny, 0.2, 0.0) +
+            (0.2 if 12 <= hour <= 16 else 0.0)
+        )
+        env_risk = np.minimum(env_risk, 1.0)
+
+        # Vehicle state
+        engine_off = batch.engine_off
+        doors_closed = batch.door_closed
+        vehicle_risk = np.minimum(
+            0.4 * engine_off + 0.4 * doors_closed + 0.2 * (engine_off & doors_closed), 1.0
+        )
+
+        components = np.stack([temp_risk, time_risk, vital_risk, env_risk, vehicle_risk], axis=1)
+        total_risk = np.clip(components @ self._weights_arr, 0.0, 1.0)
+
+        return {
+            'temperature_risk': temp_risk,
+            'time_risk': time_risk,
+            'vital_signs_risk': vital_risk,
+            'environmental_risk': env_risk,
+            'vehicle_state_risk': vehicle_risk,
+            'total_risk': total_risk
         }
-    
-    def _temperature_risk(self, temperature_c: float) -> float:
+
+    @staticmethod
+    def _temperature_risk(temperature_c: float) -> float:
         """Calculate risk based on temperature"""
-        if temperature_c >= self.TEMP_DANGER:
+        if temperature_c >= TEMP_DANGER:
             return 1.0
-        elif temperature_c >= self.TEMP_WARNING:
+        elif temperature_c >= TEMP_WARNING:
             # Linear increase from warning to danger
-            return (temperature_c - self.TEMP_WARNING) / (self.TEMP_DANGER - self.TEMP_WARNING)
+            return (temperature_c - TEMP_WARNING) / (TEMP_DANGER - TEMP_WARNING)
         else:
             return 0.0
     
-    def _time_risk(self, minutes_elapsed: float) -> float:
+    @staticmethod
+    def _time_risk(minutes_elapsed: float) -> float:
         """Calculate risk based on time elapsed"""
-        if minutes_elapsed >= self.TIME_CRITICAL:
+        if minutes_elapsed >= TIME_CRITICAL:
             return 1.0
-        elif minutes_elapsed >= self.TIME_WARNING:
-            return (minutes_elapsed - self.TIME_WARNING) / (self.TIME_CRITICAL - self.TIME_WARNING)
+        elif minutes_elapsed >= TIME_WARNING:
+            return (minutes_elapsed - TIME_WARNING) / (TIME_CRITICAL - TIME_WARNING)
         else:
             return 0.0
     
-    def _vital_signs_risk(self, vital_signs: Dict) -> float:
+    @staticmethod
+    def _vital_signs_risk(inputs: RiskInputs) -> float:
         """
         Calculate risk based on vital signs quality and patterns
         Higher risk if vital signs are detected (child present) but quality is poor
         """
-        if not vital_signs.get('vital_signs_detected', False):
+        if not inputs.vital_signs_detected:
             return 0.0  # No vital signs = likely no child
         
-        heart_rate = vital_signs.get('heart_rate_bpm', 0)
-        breathing_rate = vital_signs.get('breathing_rate_bpm', 0)
-        heartbeat_conf = vital_signs.get('heartbeat_confidence', 0)
-        breathing_conf = vital_signs.get('breathing_confidence', 0)
+        heart_rate = inputs.heart_rate_bpm
+        breathing_rate = inputs.breathing_rate_bpm
+        heartbeat_conf = inputs.heartbeat_confidence
+        breathing_conf = inputs.breathing_confidence
         
         # Risk increases if vital signs are abnormal
         risk = 0.0
         
         # Check if heart rate is in child range but confidence is low
-        if self.CHILD_HR_MIN <= heart_rate <= self.CHILD_HR_MAX:
+        if CHILD_HR_MIN <= heart_rate <= CHILD_HR_MAX:
             # Child detected - this increases risk if conditions are dangerous
             # But low confidence adds uncertainty risk
             if heartbeat_conf < 0.5:
@@ -165,122 +703,79 @@ class RadarRiskAssessor:
         
         return min(risk, 1.0)
     
-    def _environmental_risk(self, environmental: Dict) -> float:
+    @staticmethod
+    def _environmental_risk(inputs: RiskInputs, hour: int) -> float:
         """Calculate risk based on environmental conditions"""
         risk = 0.0
         
         # Temperature (already considered separately, but outdoor temp matters)
-        outdoor_temp = environmental.get('temperature_c', 25)
+        outdoor_temp = inputs.outdoor_temperature_c
         if outdoor_temp > 30:
             risk += 0.3
         elif outdoor_temp > 25:
             risk += 0.1
         
         # Humidity (high humidity reduces cooling)
-        humidity = environmental.get('humidity', 50)
+        humidity = inputs.humidity
         if humidity > 70:
             risk += 0.2
         
         # Sun exposure (estimated)
-        weather = environmental.get('weather', '').lower()
-        if 'clear' in weather or 'sunny' in weather:
+        if inputs.weather_code == WEATHER_SUNNY:
             risk += 0.2
         
         # Time of day (midday is hottest)
-        hour = datetime.now().hour
         if 12 <= hour <= 16:  # 12 PM to 4 PM
             risk += 0.2
         
         return min(risk, 1.0)
     
-    def _vehicle_state_risk(self, car_sensors: Dict) -> float:
+    @staticmethod
+    def _vehicle_state_risk(inputs: RiskInputs) -> float:
         """Calculate risk based on vehicle state"""
         risk = 0.0
         
         # Engine off increases risk
-        if car_sensors.get('engine_state') == 'off':
+        if inputs.engine_off:
             risk += 0.4
         
         # Doors closed increases risk
-        if car_sensors.get('door_state') == 'closed':
+        if inputs.door_closed:
             risk += 0.4
         
         # Windows up (estimated - would need window sensors)
         # For now, assume risk if doors closed and engine off
-        if (car_sensors.get('door_state') == 'closed' and 
-            car_sensors.get('engine_state') == 'off'):
+        if inputs.door_closed and inputs.engine_off:
             risk += 0.2
         
         return min(risk, 1.0)
     
-    def _determine_risk_level(self, total_risk: float, context: Dict) -> Tuple[str, List[str]]:
+    def _determine_risk_level(self, total_risk: float, temp: float, time_elapsed: float,
+                              vital_detected: bool) -> Tuple[str, List[str]]:
         """Determine risk level and recommended actions"""
         
-        if total_risk >= 0.8:
-            level = "CRITICAL"
-            actions = [
-                "IMMEDIATE: Contact emergency services (911)",
-                "Alert vehicle owner with emergency notification",
-                "Activate vehicle horn and lights",
-                "If possible, remotely activate climate control",
-                "Dispatch security/law enforcement to location"
-            ]
-        
-        elif total_risk >= 0.6:
-            level = "HIGH"
-            actions = [
-                "URGENT: Send emergency alert to vehicle owner",
-                "Activate vehicle alarm system",
-                "Send notification to backup contacts",
-                "Monitor vital signs continuously",
-                "Prepare emergency services dispatch"
-            ]
-        
-        elif total_risk >= 0.4:
-            level = "MODERATE"
-            actions = [
-                "WARNING: Send alert to vehicle owner",
-                "Check if this is a false positive",
-                "Monitor situation for 5 minutes",
-                "Alert backup contact",
-                "Record all sensor data for analysis"
-            ]
-        
-        elif total_risk >= 0.2:
-            level = "LOW"
-            actions = [
-                "NOTIFICATION: Send informational alert",
-                "Monitor for changes",
-                "Check environmental conditions",
-                "Update risk assessment in 2 minutes"
-            ]
-        
-        else:
-            level = "SAFE"
-            actions = [
-                "Continue routine monitoring",
-                "Log normal conditions",
-                "Update dashboard status"
-            ]
+        # Number of level boundaries reached indexes the lookup tables
+        idx = (total_risk >= 0.2) + (total_risk >= 0.4) + (total_risk >= 0.6) + (total_risk >= 0.8)
+        level = _LEVEL_NAMES[idx]
+        actions = list(_ACTIONS_LUT[idx])
         
         # Add context-specific actions
-        if context.get('temperature', 25) > 35:
+        if temp > 35:
             actions.append("⚠️ High temperature detected - expedite response")
         
-        if context.get('time_elapsed', 0) > 20:
+        if time_elapsed > 20:
             actions.append("⏰ Vehicle occupied for extended period")
         
-        if context.get('vital_signs_detected', False):
+        if vital_detected:
             actions.append("👶 Child detected via mmWave radar")
         
         return level, actions
     
-    def _detect_anomalies(self, radar_data: Dict, car_sensors: Dict, 
-                         time_elapsed: float) -> List[Dict]:
+    def _detect_anomalies(self, vital_signs: Dict, quality: Dict, motion: Dict,
+                         car_sensors: Dict, time_elapsed: float) -> List[Dict]:
         """Detect anomalous patterns that might indicate problems"""
         anomalies = []
         
-        vital_signs = radar_data.get('vital_signs', {})
         heart_rate = vital_signs.get('heart_rate_bpm', 0)
         breathing_rate = vital_signs.get('breathing_rate_bpm', 0)
         
@@ -289,19 +784,19 @@ class RadarRiskAssessor:
             # Check if heart rate is abnormally high/low for child
             if self.CHILD_HR_MIN <= heart_rate <= self.CHILD_HR_MAX:
                 # Calculate z-score for anomaly detection
-                z_score = abs(heart_rate - self.normal_patterns['child_hr_mean']) / self.normal_patterns['child_hr_std']
+                z_score = abs(heart_rate - _NORMAL_PATTERNS['child_hr_mean']) / _NORMAL_PATTERNS['child_hr_std']
                 if z_score > 2.0:
                     anomalies.append({
                         'type': 'abnormal_heart_rate',
                         'severity': 'high' if z_score > 3 else 'medium',
                         'value': heart_rate,
-                        'expected_range': f"{self.CHILD_HR_MIN}-{self.CHILD_HR_MAX} BPM",
+                        'expected_range': f"{self.CHILD_HR_MIN:g}-{self.CHILD_HR_MAX:g} BPM",
                         'description': f"Heart rate {heart_rate} BPM is statistically unusual"
                     })
             
             # Check breathing rate
             if 10 <= breathing_rate <= 40:  # Plausible range
-                z_score = abs(breathing_rate - self.normal_patterns['child_br_mean']) / self.normal_patterns['child_br_std']
+                z_score = abs(breathing_rate - _NORMAL_PATTERNS['child_br_mean']) / _NORMAL_PATTERNS['child_br_std']
                 if z_score > 2.0:
                     anomalies.append({
                         'type': 'abnormal_breathing',
@@ -313,7 +808,7 @@ class RadarRiskAssessor:
         
         # 2. Temperature rise anomaly
         temp = car_sensors.get('temperature_c', 25)
-        expected_rise = time_elapsed * self.normal_patterns['car_temp_rise_rate']
+        expected_rise = time_elapsed * _NORMAL_PATTERNS['car_temp_rise_rate']
         if temp > 30 and time_elapsed > 10:
             actual_rise = temp - 25  # Assuming starting at 25°C
             if actual_rise > expected_rise * 1.5:
@@ -326,7 +821,6 @@ class RadarRiskAssessor:
                 })
         
         # 3. Signal quality anomalies
-        quality = radar_data.get('quality_metrics', {})
         if quality.get('overall_quality', 0) < 0.3:
             anomalies.append({
                 'type': 'poor_signal_quality',
@@ -336,7 +830,6 @@ class RadarRiskAssessor:
             })
         
         # 4. Motion artifact when expecting stillness
-        motion = radar_data.get('motion_artifact', {})
         if motion.get('has_motion_artifact', False) and time_elapsed > 15:
             anomalies.append({
                 'type': 'unexpected_movement',
@@ -347,40 +840,112 @@ class RadarRiskAssessor:
         
         return anomalies
     
-    def _calculate_confidence(self, radar_data: Dict, car_sensors: Dict) -> float:
+    def _detect_anomalies_batch(self, detected_arr: np.ndarray, hr_arr: np.ndarray,
+                                br_arr: np.ndarray, temp_arr: np.ndarray,
+                                time_arr: np.ndarray, quality_arr: np.ndarray,
+                                motion_arr: np.ndarray,
+                                movement_arr: Optional[np.ndarray] = None) -> List[List[Dict]]:
+        """
+        _detect_anomalies for N scenarios at once
+
+        The checks run as boolean masks over the whole batch and anomaly dicts
+        are only built for the flagged rows. Returns one list per scenario.
+        """
+        hr_arr = np.asarray(hr_arr, dtype=np.float64)
+        br_arr = np.asarray(br_arr, dtype=np.float64)
+        temp_arr = np.asarray(temp_arr, dtype=np.float64)
+        time_arr = np.asarray(time_arr, dtype=np.float64)
+        quality_arr = np.asarray(quality_arr, dtype=np.float64)
+        detected_arr = np.asarray(detected_arr, dtype=bool)
+        motion_arr = np.asarray(motion_arr, dtype=bool)
+        if movement_arr is None:
+            movement_arr = np.zeros(len(hr_arr))
+        anomalies = [[] for _ in range(len(hr_arr))]
+
+        # 1. Vital sign anomalies, as z-scores against the normal patterns
+        hr_z = np.abs(hr_arr - _NORMAL_PATTERNS['child_hr_mean']) / _NORMAL_PATTERNS['child_hr_std']
+        br_z = np.abs(br_arr - _NORMAL_PATTERNS['child_br_mean']) / _NORMAL_PATTERNS['child_br_std']
+        mask_hr = (detected_arr & (hr_arr >= self.CHILD_HR_MIN) &
+                   (hr_arr <= self.CHILD_HR_MAX) & (hr_z > 2.0))
+        mask_br = detected_arr & (br_arr >= 10) & (br_arr <= 40) & (br_z > 2.0)
+
+        rows = np.flatnonzero(mask_hr)
+        severity = np.where(hr_z[rows] > 3, 'high', 'medium')
+        for i, heart_rate, level in zip(rows.tolist(), hr_arr[rows].tolist(), severity.tolist()):
+            anomalies[i].append({
+                'type': 'abnormal_heart_rate',
+                'severity': level,
+                'value': heart_rate,
+                'expected_range': f"{self.CHILD_HR_MIN:g}-{self.CHILD_HR_MAX:g} BPM",
+                'description': f"Heart rate {heart_rate} BPM is statistically unusual"
+            })
+
+        rows = np.flatnonzero(mask_br)
+        for i, breathing_rate in zip(rows.tolist(), br_arr[rows].tolist()):
+            anomalies[i].append({
+                'type': 'abnormal_breathing',
+                'severity': 'medium',
+                'value': breathing_rate,
+                'expected_range': "20-30 breaths/min",
+                'description': f"Breathing rate {breathing_rate} BPM is unusual"
+            })
+
+        # 2. Temperature rise anomaly
+        actual_rise = temp_arr - 25
+        expected_rise = time_arr * _NORMAL_PATTERNS['car_temp_rise_rate']
+        mask_temp = (temp_arr > 30) & (time_arr > 10) & (actual_rise > expected_rise * 1.5)
+        rows = np.flatnonzero(mask_temp)
+        for i, temp, time_elapsed, rise in zip(rows.tolist(), temp_arr[rows].tolist(),
+                                               time_arr[rows].tolist(), actual_rise[rows].tolist()):
+            anomalies[i].append({
+                'type': 'rapid_temperature_rise',
+                'severity': 'high',
+                'temperature': temp,
+                'time_elapsed': time_elapsed,
+                'description': f"Temperature rising faster than expected: {rise:.1f}°C in {time_elapsed:.0f}min"
+            })
+
+        # 3. Signal quality anomalies
+        rows = np.flatnonzero(quality_arr < 0.3)
+        for i, quality in zip(rows.tolist(), quality_arr[rows].tolist()):
+            anomalies[i].append({
+                'type': 'poor_signal_quality',
+                'severity': 'medium',
+                'value': quality,
+                'description': "Low mmWave signal quality - may affect vital sign detection"
+            })
+
+        # 4. Motion artifact when expecting stillness
+        rows = np.flatnonzero(motion_arr & (time_arr > 15))
+        for i, movement in zip(rows.tolist(), np.asarray(movement_arr)[rows].tolist()):
+            anomalies[i].append({
+                'type': 'unexpected_movement',
+                'severity': 'low',
+                'movement_index': movement,
+                'description': "Movement detected in stationary vehicle"
+            })
+
+        return anomalies
+    
+    def _calculate_confidence(self, quality: Dict, vital_signs: Dict, car_sensors: Dict) -> float:
         """Calculate confidence in risk assessment"""
-        confidence = 1.0
-        
-        # Reduce confidence based on data quality
-        quality = radar_data.get('quality_metrics', {})
+        # Data quality, sensor coverage (of 3) and vital-sign confidence
         overall_quality = quality.get('overall_quality', 0.5)
-        confidence *= overall_quality
-        
-        # Reduce confidence if sensor data is sparse
-        sensor_count = sum(1 for key in ['temperature_c', 'door_state', 'engine_state'] 
-                          if key in car_sensors)
-        sensor_confidence = sensor_count / 3
-        confidence *= sensor_confidence
-        
-        # Reduce confidence if vital signs have low confidence
-        vital_signs = radar_data.get('vital_signs', {})
+        sensor_count = ('temperature_c' in car_sensors) + ('door_state' in car_sensors) + \
+            ('engine_state' in car_sensors)
         vital_confidence = (vital_signs.get('heartbeat_confidence', 0) + 
-                          vital_signs.get('breathing_confidence', 0)) / 2
-        confidence *= max(0.3, vital_confidence)  # Don't reduce below 0.3
+                            vital_signs.get('breathing_confidence', 0)) / 2
         
-        return confidence
+        # Don't let vital signs reduce confidence below 0.3
+        return overall_quality * sensor_count / 3 * (0.3 if vital_confidence < 0.3 else vital_confidence)
     
-    def _generate_summary(self, total_risk: float, risk_level: str,
-                         radar_data: Dict, car_sensors: Dict, 
+    def _generate_summary(self, risk_level: str, temp: float, heart_rate,
                          time_elapsed: float) -> str:
         """Generate human-readable risk summary"""
         
-        vital_signs = radar_data.get('vital_signs', {})
-        temp = car_sensors.get('temperature_c', 25)
-        
         if risk_level == "CRITICAL":
             return f"🚨 CRITICAL RISK: Child detected in vehicle for {time_elapsed:.0f}min at {temp}°C. " \
-                   f"Heart rate: {vital_signs.get('heart_rate_bpm', 'N/A')} BPM. " \
+                   f"Heart rate: {heart_rate} BPM. " \
                    f"IMMEDIATE ACTION REQUIRED."
         
         elif risk_level == "HIGH":
@@ -399,33 +964,71 @@ class RadarRiskAssessor:
             return f"✅ SAFE: No significant risk detected. " \
                    f"Monitoring normal conditions."
     
-    def generate_report(self, risk_assessment: Dict, scenario_id: str = None) -> Dict:
+    def generate_report(self, risk_assessment: Dict, scenario_id: str = None,
+                        now: Optional[datetime] = None) -> Dict:
         """Generate comprehensive risk report"""
         
+        if now is None:
+            now = datetime.now()
+        
         report = {
-            'report_id': f"risk_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            'report_id': f"risk_report_{now:%Y%m%d_%H%M%S}",
             'scenario_id': scenario_id,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now.isoformat(),
             'risk_assessment': risk_assessment,
             'statistics': {
                 'risk_distribution': self._calculate_statistics(risk_assessment),
                 'trend_analysis': self._analyze_trends(risk_assessment)
             },
             'compliance_check': self._check_compliance(risk_assessment),
-            'export_formats': ['json', 'csv', 'pdf']  # Available export formats
+            'export_formats': _EXPORT_FORMATS
         }
         
         return report
     
+    def generate_report_stream(self, assessments: Iterable[Tuple[str, Mapping]],
+                               now: Optional[datetime] = None) -> Iterator[bytes]:
+        """
+        Reports for many (scenario_id, assessment) pairs as NDJSON lines
+
+        Each report is serialized with orjson as soon as it is built, so a
+        fleet export never holds more than one report in memory.
+        """
+        if now is None:
+            now = datetime.now()
+        
+        for scenario_id, assessment in assessments:
+            if isinstance(assessment, RiskResult):
+                # orjson reads dict subclasses directly, bypassing the lazy summary
+                assessment._complete()
+            report = self.generate_report(assessment, scenario_id=scenario_id, now=now)
+            yield orjson.dumps(report, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+    
     def _calculate_statistics(self, risk_assessment: Dict) -> Dict:
         """Calculate statistics for reporting"""
         components = risk_assessment.get('risk_components', {})
         
+        # One pass over the five components; numpy costs more than the maths here
+        total = 0.0
+        total_sq = 0.0
+        highest_key, highest = None, None
+        dominant = []
+        for key, value in components.items():
+            total += value
+            total_sq += value * value
+            if highest is None or value > highest:
+                highest_key, highest = key, value
+            if value > 0.3:
+                dominant.append(key)
+        
+        n = len(components)
+        mean = total / n
+        
         return {
-            'highest_risk_component': max(components.items(), key=lambda x: x[1])[0],
-            'average_component_risk': np.mean(list(components.values())),
-            'risk_variance': np.var(list(components.values())),
-            'dominant_factors': [k for k, v in components.items() if v > 0.3]
+            'highest_risk_component': highest_key,
+            'average_component_risk': mean,
+            'risk_variance': max(0.0, total_sq / n - mean * mean),
+            'dominant_factors': dominant
         }
     
     def _analyze_trends(self, risk_assessment: Dict) -> Dict:
@@ -451,7 +1054,6 @@ class RadarRiskAssessor:
     def _check_compliance(self, risk_assessment: Dict) -> Dict:
         """Check compliance with safety standards"""
         # Simplified compliance check
-        temp = risk_assessment.get('assessment_summary', '')
         risk_level = risk_assessment.get('risk_level', 'SAFE')
         
         standards = {
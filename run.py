@@ -24,6 +24,45 @@ from pathlib import Path
 project_root = Path(__file__).parent.absolute()
 sys.path.insert(0, str(project_root))
 
+# Keep Numba's compiled-kernel cache with the project so later runs reuse it
+os.environ.setdefault("NUMBA_CACHE_DIR", str(project_root / ".numba_cache"))
+
+# Processors and simulators reused across pipeline runs in one process
+_PROCESSOR_CACHE = {}
+_SIMULATOR_CACHE = {}
+
+def _get_processor(sampling_rate):
+    """Shared CompatibleMMWaveProcessor for a sampling rate"""
+    processor = _PROCESSOR_CACHE.get(sampling_rate)
+    if processor is None:
+        from processing.compatible_processor import CompatibleMMWaveProcessor
+        processor = _PROCESSOR_CACHE[sampling_rate] = CompatibleMMWaveProcessor(sampling_rate=sampling_rate)
+    return processor
+
+def _get_simulator(sampling_rate, duration):
+    """Shared MMWaveSimulator for a (sampling rate, duration) pair"""
+    key = (sampling_rate, duration)
+    simulator = _SIMULATOR_CACHE.get(key)
+    if simulator is None:
+        from utils.mmwave_simulator import MMWaveSimulator
+        simulator = _SIMULATOR_CACHE[key] = MMWaveSimulator(sampling_rate=sampling_rate, duration=duration)
+    return simulator
+
+# Diagnostic plot figure, reused (axes cleared) across pipeline runs
+_FIGURE = None
+
+def _get_figure():
+    """Shared Agg figure and axes for the signal plot"""
+    global _FIGURE
+    if _FIGURE is None:
+        import matplotlib
+        matplotlib.use('Agg')  # Use non-interactive backend
+        import matplotlib.pyplot as plt
+        _FIGURE = plt.subplots(figsize=(10, 6))
+    fig, ax = _FIGURE
+    ax.cla()
+    return fig, ax
+
 def print_banner():
     """Print application banner"""
     banner = """
@@ -43,12 +82,14 @@ def print_banner():
     """
     print(banner)
 
-def start_api_server(host="0.0.0.0", port=8000, reload=True):
+def start_api_server(host="0.0.0.0", port=8000, reload=False, workers=1):
     """Start FastAPI server"""
     print(f"🚀 Starting GuardianSensor API server...")
     print(f"   Host: {host}")
     print(f"   Port: {port}")
     print(f"   Reload: {reload}")
+    if not reload:
+        print(f"   Workers: {workers}")
     print(f"   Docs: http://{host}:{port}/docs")
     print(f"   Health: http://{host}:{port}/health")
     print()
@@ -59,6 +100,9 @@ def start_api_server(host="0.0.0.0", port=8000, reload=True):
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else workers,  # uvicorn can't reload with workers
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # no uvloop on Windows
+        http="httptools",
         log_level="info"
     )
 
@@ -70,11 +114,17 @@ def start_dashboard(port=8501):
     print()
     
     dashboard_path = project_root / "dashboard" / "app.py"
-    subprocess.run([
+    args = [
         "streamlit", "run", str(dashboard_path),
         "--server.port", str(port),
         "--server.address", "0.0.0.0"
-    ])
+    ]
+    if os.name == 'nt':
+        subprocess.run(args)
+    else:
+        # Replace this process with streamlit rather than waiting on a child
+        sys.stdout.flush()
+        os.execvp(args[0], args)
 
 def run_signal_processing():
     """Run signal processing pipeline - FIXED VERSION"""
@@ -83,26 +133,22 @@ def run_signal_processing():
     try:
         # Try compatible processor first
         try:
-            from processing.compatible_processor import CompatibleMMWaveProcessor
-            from utils.mmwave_simulator import MMWaveSimulator
+            processor = _get_processor(100)
             
             print("   Using compatible processor...")
             
-            # Generate test data
-            simulator = MMWaveSimulator(sampling_rate=100, duration=30)
-            iq_data = simulator.generate_mmwave_iq_data(has_child=True, movement_level='low')
+            # Generate test data (single precision, as the processor works in it)
+            import numpy as np
+            simulator = _get_simulator(100, 30)
+            iq_data = simulator.generate_mmwave_iq_data(has_child=True, movement_level='low', dtype=np.complex64)
             
             # Process data
-            processor = CompatibleMMWaveProcessor(sampling_rate=100)
             result = processor.process_iq_data(iq_data)
             
         except ImportError:
             # Fallback to basic simulator
-            from utils.mmwave_simulator import MMWaveSimulator
-            import numpy as np
-            
             print("   Using basic simulator...")
-            simulator = MMWaveSimulator(sampling_rate=100, duration=30)
+            simulator = _get_simulator(100, 30)
             iq_data = simulator.generate_mmwave_iq_data(has_child=True)
             vital_signs = simulator.extract_vital_signs(iq_data)
             result = {'vital_signs': vital_signs, 'status': 'simulated'}
@@ -117,21 +163,18 @@ def run_signal_processing():
         
         # Simple visualization
         try:
-            import matplotlib
-            matplotlib.use('Agg')  # Use non-interactive backend
-            import matplotlib.pyplot as plt
             import numpy as np
             import os
             
             os.makedirs("outputs/visualizations", exist_ok=True)
             
-            plt.figure(figsize=(10, 6))
-            plt.plot(np.abs(iq_data)[:500])
-            plt.title('mmWave Radar Signal (First 500 samples)')
-            plt.xlabel('Sample')
-            plt.ylabel('Amplitude')
-            plt.grid(True)
-            plt.savefig('outputs/visualizations/mmwave_simple.png', dpi=150)
+            fig, ax = _get_figure()
+            ax.plot(np.abs(iq_data)[:500])
+            ax.set_title('mmWave Radar Signal (First 500 samples)')
+            ax.set_xlabel('Sample')
+            ax.set_ylabel('Amplitude')
+            ax.grid(True)
+            fig.savefig('outputs/visualizations/mmwave_simple.png', dpi=96, metadata={})
             print(f"   Visualization saved: outputs/visualizations/mmwave_simple.png")
         except Exception as e:
             print(f"   ⚠️  Could not create visualization: {e}")
@@ -148,13 +191,13 @@ def generate_simulation_data(num_scenarios=5):
     print(f"🧪 Generating {num_scenarios} simulation scenarios...")
     
     try:
-        from utils.mmwave_simulator import MMWaveSimulator
         from utils.data_collector import DataCollector  # Your existing class
+        from utils.mmwave_simulator import MMWaveSimulator
         
         # Generate mmWave data
         print("   Generating mmWave radar data...")
         simulator = MMWaveSimulator(sampling_rate=100, duration=60)
-        scenarios = simulator.generate_scenario_dataset(num_scenarios=num_scenarios)
+        scenarios = simulator.generate_scenario_dataset(num_scenarios)
         
         # Collect weather data using YOUR DataCollector class
         print("   Collecting weather data...")
@@ -188,18 +231,19 @@ def run_tests():
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pytest"])
         import pytest
     
-    # Run pytest
-    result = subprocess.run([
-        "pytest", "tests/", 
-        "-v"
-    ])
+    # Run pytest in this interpreter so already-imported modules are reused
+    returncode = int(pytest.main([
+        "tests/",
+        "-v",
+        "-p", "no:cacheprovider"
+    ]))
     
-    if result.returncode == 0:
+    if returncode == 0:
         print("✅ All tests passed!")
     else:
         print("❌ Some tests failed")
     
-    return result.returncode
+    return returncode
 
 def main():
     """Main entry point"""
@@ -215,6 +259,7 @@ Examples:
   python run.py test             # Run tests
   python run.py simulate         # Generate test data
   python run.py api --port 8080  # Start API on custom port
+  python run.py api --reload     # Start API with auto-reload
         """
     )
     
@@ -240,9 +285,18 @@ Examples:
     )
     
     parser.add_argument(
-        "--no-reload", 
+        "--reload", 
         action="store_true",
-        help="Disable auto-reload for development"
+        help="Enable auto-reload for development"
+    )
+    
+    # Alerts and sensor history live in each worker's memory (see api/main.py),
+    # so more than one worker is opt-in
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        default=1,
+        help="API worker processes, ignored with --reload (default: 1)"
     )
     
     args = parser.parse_args()
@@ -258,7 +312,8 @@ Examples:
         start_api_server(
             host=args.host,
             port=args.port,
-            reload=not args.no_reload
+            reload=args.reload,
+            workers=args.workers
         )
         
     elif args.command == "dashboard":
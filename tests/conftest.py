@@ -0,0 +1,26 @@
+# tests/conftest.py - shared fixtures
+import sys
+import os
+
+import pytest
+
+# Add project root to path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+@pytest.fixture(scope="session")
+def mmwave_sim():
+    """One 1 s / 100 Hz mmWave simulator shared by the whole session"""
+    from utils.mmwave_simulator import MMWaveSimulator
+    return MMWaveSimulator(sampling_rate=100, duration=1)
+
+@pytest.fixture(scope="session")
+def iq_30s():
+    """30 s of simulated child-present I/Q at 100 Hz, synthesized once per session
+
+    Read-only, so a test that mutates it fails instead of leaking into others
+    """
+    from utils.mmwave_simulator import MMWaveSimulator
+    iq_data = MMWaveSimulator(sampling_rate=100, duration=30).generate_mmwave_iq_data(has_child=True)
+    iq_data.flags.writeable = False
+    return iq_data
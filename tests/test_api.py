@@ -0,0 +1,100 @@
+import asyncio
+
+import orjson
+import pandas as pd
+import pytest
+
+import api.main
+from api.main import RiskCalculator, SensorData
+
+
+class TestRiskCalculator:
+    """Unit tests for the API risk calculator."""
+    
+    SAMPLES = [
+        {"temperature_c": 42.5, "weight_left_kg": 18.0, "weight_right_kg": 0.0,
+         "motion_detected": False, "door_state": "closed", "engine_state": "off"},
+        {"temperature_c": 30.0, "weight_left_kg": 15.0, "weight_right_kg": 75.0,
+         "motion_detected": True, "door_state": "closed", "engine_state": "on"},
+        {"temperature_c": 22.0, "weight_left_kg": 0.0, "weight_right_kg": 75.0,
+         "motion_detected": True, "door_state": "open", "engine_state": "on"},
+    ]
+    
+    def test_batch_matches_single_sample(self):
+        """Test batch scoring agrees with the per-sample calculation."""
+        batch = RiskCalculator.calculate_risk_batch(pd.DataFrame(self.SAMPLES))
+        
+        for sample, (_, row) in zip(self.SAMPLES, batch.iterrows()):
+            expected = RiskCalculator.calculate_risk(SensorData.model_construct(**sample))
+            assert row["temperature_risk"] == expected.temperature_risk
+            assert row["occupancy_risk"] == expected.occupancy_risk
+            assert row["total_risk"] == expected.total_risk
+            assert row["recommendation"] == expected.recommendation
+
+
+class _StopSimulation(Exception):
+    pass
+
+
+def test_simulate_sensor_updates_tick(monkeypatch):
+    """Test one background simulator tick records a sample and scores it"""
+    sleeps = []
+    recorded = []
+    
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        if len(sleeps) > 1:
+            raise _StopSimulation
+    
+    scored = []
+    real_scores = RiskCalculator.calculate_risk_scores
+    
+    def record_scores(sensor_data):
+        scores = real_scores(sensor_data)
+        scored.append(scores)
+        return scores
+    
+    monkeypatch.setattr(api.main.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(api.main, "_record_sensor_sample", recorded.append)
+    monkeypatch.setattr(RiskCalculator, "calculate_risk_scores", staticmethod(record_scores))
+    monkeypatch.setattr(api.main, "_history_count", 0)
+    
+    with pytest.raises(_StopSimulation):
+        asyncio.run(api.main.simulate_sensor_updates())
+    
+    assert len(recorded) == 1
+    assert len(scored) == 1
+    assert scored[0] == real_scores(SensorData.model_construct(**recorded[0]))
+    assert 0 <= scored[0]["total_risk"] <= 1
+
+
+def test_dashboard_sensor_history_layouts(monkeypatch):
+    """Test /dashboard serves the sensor history as records, or column-wise on request"""
+    monkeypatch.setattr(api.main, "_history_columns",
+                        {name: column.copy() for name, column in api.main._history_columns.items()})
+    monkeypatch.setattr(api.main, "_history_count", 0)
+    monkeypatch.setattr(api.main, "_dash_cache", {})
+    
+    empty = orjson.loads(asyncio.run(api.main.get_dashboard_data()).body)
+    assert empty["sensor_history"] == []
+    assert "sensor_history_columns" not in empty
+    
+    sample = {
+        "temperature_c": 31.5,
+        "weight_left_kg": 12.0,
+        "weight_right_kg": 0.0,
+        "motion_detected": True,
+        "door_state": "closed",
+        "engine_state": "off",
+        "timestamp": "2024-07-01T14:30:00",
+        "received_at": "2024-07-01T14:30:01"
+    }
+    api.main._record_sensor_sample(sample)
+    
+    records = orjson.loads(asyncio.run(api.main.get_dashboard_data()).body)
+    assert records["sensor_history"] == [sample]
+    assert "sensor_history_columns" not in records
+    
+    columns = orjson.loads(asyncio.run(api.main.get_dashboard_data("columns")).body)
+    assert columns["sensor_history_columns"]["temperature_c"] == [31.5]
+    assert "sensor_history" not in columns
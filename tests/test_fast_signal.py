@@ -0,0 +1,85 @@
+import numpy as np
+from scipy.signal import butter, find_peaks, sosfilt
+from utils.fast_signal import (
+    count_peaks, magnitude_bandpass, magnitude_bandpass_stream, magnitude_peaks, magnitude_stats
+)
+
+
+def test_magnitude_peaks_matches_find_peaks():
+    """Fused kernel gives the same amplitude and peaks as np.abs + find_peaks"""
+    rng = np.random.default_rng(0)
+    iq_data = rng.standard_normal(1000) + 1j * rng.standard_normal(1000)
+    # Include a flat-topped peak, which find_peaks reports at its middle
+    iq_data[100:103] = 10.0
+
+    amplitude, peaks = magnitude_peaks(iq_data)
+    expected = np.abs(iq_data)
+    expected_peaks, _ = find_peaks(expected, height=expected.mean() + expected.std())
+
+    np.testing.assert_allclose(amplitude, expected)
+    np.testing.assert_array_equal(peaks, expected_peaks)
+    assert 101 in peaks
+
+
+def test_magnitude_peaks_distance():
+    """Minimum peak distance keeps the same peaks as find_peaks(distance=...)"""
+    rng = np.random.default_rng(1)
+    iq_data = rng.standard_normal(2000) + 1j * rng.standard_normal(2000)
+
+    amplitude, peaks = magnitude_peaks(iq_data, 25)
+    expected_peaks, _ = find_peaks(amplitude, height=amplitude.mean() + amplitude.std(), distance=25)
+
+    np.testing.assert_array_equal(peaks, expected_peaks)
+    assert np.all(np.diff(peaks) >= 25)
+
+
+def test_count_peaks_matches_find_peaks():
+    """Peak count agrees with find_peaks, which rounds a fractional distance up"""
+    rng = np.random.default_rng(2)
+    x = np.cumsum(rng.standard_normal(3000))
+
+    for distance in (1, 100 * 0.3, 100 * 0.8):
+        expected_peaks, _ = find_peaks(x, distance=distance)
+        assert count_peaks(x, int(np.ceil(distance))) == len(expected_peaks)
+
+
+def test_magnitude_bandpass_matches_sosfilt():
+    """Fused magnitude + dual SOS cascade matches sosfilt on np.abs"""
+    rng = np.random.default_rng(3)
+    iq_data = rng.standard_normal(3000) + 1j * rng.standard_normal(3000)
+    sos_a = butter(4, [0.1, 0.5], btype='band', fs=100, output='sos')
+    sos_b = butter(4, [0.8, 3.0], btype='band', fs=100, output='sos')
+
+    out_a, out_b = magnitude_bandpass(iq_data, sos_a, sos_b)
+
+    np.testing.assert_allclose(out_a, sosfilt(sos_a, np.abs(iq_data)), rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(out_b, sosfilt(sos_b, np.abs(iq_data)), rtol=1e-9, atol=1e-12)
+
+
+def test_magnitude_stats_matches_numpy():
+    """One-sweep amplitude mean/std agree with np.abs(...).mean()/.std()"""
+    rng = np.random.default_rng(4)
+    iq_data = (rng.standard_normal(5000) + 1j * rng.standard_normal(5000)).astype(np.complex64)
+
+    mean, std = magnitude_stats(iq_data)
+    amplitude = np.abs(iq_data).astype(np.float64)
+
+    assert np.isclose(mean, amplitude.mean(), rtol=1e-9)
+    assert np.isclose(std, amplitude.std(), rtol=1e-6)
+
+
+def test_magnitude_bandpass_stream_chunks():
+    """Filtering consecutive chunks with carried state equals one pass"""
+    rng = np.random.default_rng(5)
+    iq_data = rng.standard_normal(3000) + 1j * rng.standard_normal(3000)
+    sos_a = butter(4, [0.1, 0.5], btype='band', fs=100, output='sos')
+    sos_b = butter(4, [0.8, 3.0], btype='band', fs=100, output='sos')
+
+    zi_a = np.zeros((len(sos_a), 2))
+    zi_b = np.zeros((len(sos_b), 2))
+    chunks = [magnitude_bandpass_stream(chunk, sos_a, sos_b, zi_a, zi_b)
+              for chunk in np.array_split(iq_data, 7)]
+    out_a, out_b = magnitude_bandpass(iq_data, sos_a, sos_b)
+
+    np.testing.assert_allclose(np.concatenate([c[0] for c in chunks]), out_a, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(np.concatenate([c[1] for c in chunks]), out_b, rtol=1e-12, atol=1e-15)
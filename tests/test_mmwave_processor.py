@@ -1,6 +1,19 @@
 import pytest
 import numpy as np
+import scipy.signal as signal
 from processing.mmwave_processor import MMWaveProcessor
+from utils.mmwave_simulator import MMWaveSimulator
+
+
+def _medfilt_snr(self, signal_data):
+    """The original _estimate_snr, with medfilt(5) as the noise reference"""
+    if len(signal_data) == 0:
+        return 0
+    signal_power = np.mean(signal_data ** 2)
+    noise_power = np.var(signal_data - signal.medfilt(signal_data, 5))
+    if noise_power > 0:
+        return max(10 * np.log10(float(signal_power) / float(noise_power)), 0)
+    return 0
 
 
 class TestMMWaveProcessor:
@@ -25,15 +38,26 @@ class TestMMWaveProcessor:
         assert result.shape == iq_data.shape
         assert np.abs(np.mean(result)) < 0.1
     
-    def test_vital_sign_detection(self):
+    def test_vital_sign_detection(self, iq_30s):
         """Test vital sign detection produces expected output structure."""
-        from utils.mmwave_simulator import MMWaveSimulator
-        
-        simulator = MMWaveSimulator(sampling_rate=100, duration=30)
-        iq_data = simulator.generate_mmwave_iq_data(has_child=True)
-        
         processor = MMWaveProcessor(sampling_rate=100)
-        result = processor.process_iq_data(iq_data)
+        result = processor.process_iq_data(iq_30s)
         
         assert isinstance(result, dict)
-        assert all(key in result for key in ['vital_signs', 'quality_metrics', 'motion_artifact'])
\ No newline at end of file
+        assert all(key in result for key in ['vital_signs', 'quality_metrics', 'motion_artifact'])
+    
+    @pytest.mark.parametrize("has_child,movement_level", [
+        (True, 'low'), (True, 'high'), (False, 'low')
+    ])
+    def test_quality_threshold_matches_medfilt_snr(self, monkeypatch, has_child, movement_level):
+        """Test overall_quality stays on the medfilt SNR's side of the 0.3 poor-signal threshold"""
+        processor = MMWaveProcessor(sampling_rate=100)
+        iq_data = MMWaveSimulator(sampling_rate=100, duration=30, seed=7).generate_mmwave_iq_data(
+            has_child=has_child, movement_level=movement_level
+        )
+        quality = processor.process_iq_data(iq_data)['quality_metrics']['overall_quality']
+        
+        monkeypatch.setattr(MMWaveProcessor, "_estimate_snr", _medfilt_snr)
+        reference = processor.process_iq_data(iq_data)['quality_metrics']['overall_quality']
+        
+        assert (quality < 0.3) == (reference < 0.3)
@@ -0,0 +1,168 @@
+import json
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from risk.risk_assessor import RadarRiskAssessor, RiskInputs, RiskInputsBatch
+
+
+NOW = datetime(2024, 7, 1, 14, 30)
+
+# (radar_data, car_sensors, environmental, time_elapsed_min) per vehicle
+SCENARIOS = [
+    (
+        {'vital_signs': {'vital_signs_detected': True, 'heart_rate_bpm': 105,
+                         'breathing_rate_bpm': 25, 'heartbeat_confidence': 0.8,
+                         'breathing_confidence': 0.7},
+         'quality_metrics': {'overall_quality': 0.9}},
+        {'temperature_c': 38, 'engine_state': 'off', 'door_state': 'closed'},
+        {'temperature_c': 33, 'humidity': 75, 'weather': 'Sunny'},
+        25
+    ),
+    (
+        {'vital_signs': {'vital_signs_detected': True, 'heart_rate_bpm': 70,
+                         'breathing_rate_bpm': 15, 'heartbeat_confidence': 0.3,
+                         'breathing_confidence': 0.4},
+         'quality_metrics': {'overall_quality': 0.2}},
+        {'temperature_c': 29, 'engine_state': 'off', 'door_state': 'open'},
+        {'temperature_c': 27, 'humidity': 40, 'weather': 'Cloudy'},
+        12
+    ),
+    (
+        {'vital_signs': {'vital_signs_detected': False}},
+        {'temperature_c': 22, 'engine_state': 'on', 'door_state': 'closed'},
+        {'temperature_c': 18, 'humidity': 55, 'weather': 'Rain'},
+        3
+    ),
+]
+
+
+def scenario_inputs():
+    return [RiskInputs.from_dicts(radar, car, env, minutes) for radar, car, env, minutes in SCENARIOS]
+
+
+def scenario_frame():
+    """SCENARIOS in the RiskInputsBatch.from_frame layout"""
+    rows = []
+    for radar, car, env, minutes in SCENARIOS:
+        vitals = radar['vital_signs']
+        rows.append({
+            'temperature_c': car['temperature_c'],
+            'time_elapsed_min': minutes,
+            'vital_signs_detected': vitals['vital_signs_detected'],
+            'heart_rate_bpm': vitals.get('heart_rate_bpm', 0),
+            'breathing_rate_bpm': vitals.get('breathing_rate_bpm', 0),
+            'heartbeat_confidence': vitals.get('heartbeat_confidence', 0),
+            'breathing_confidence': vitals.get('breathing_confidence', 0),
+            'outdoor_temperature_c': env['temperature_c'],
+            'humidity': env['humidity'],
+            'weather': env['weather'],
+            'engine_state': car['engine_state'],
+            'door_state': car['door_state']
+        })
+    return pd.DataFrame(rows)
+
+
+def assert_same_scores(result, expected):
+    assert result['risk_components'] == expected['risk_components']
+    assert result['total_risk'] == expected['total_risk']
+    assert result['risk_level'] == expected['risk_level']
+
+
+class TestRadarRiskAssessor:
+    """Equivalence tests for the RadarRiskAssessor fast paths."""
+    
+    @pytest.fixture
+    def assessor(self):
+        """Fixture providing a default RadarRiskAssessor instance."""
+        return RadarRiskAssessor()
+    
+    def test_batch_from_inputs_matches_single(self, assessor):
+        """Test assess_risk_batch over from_inputs matches per-vehicle assess_risk"""
+        batch = RiskInputsBatch.from_inputs(scenario_inputs())
+        scores = assessor.assess_risk_batch(batch, now=NOW)
+        
+        for i, scenario in enumerate(SCENARIOS):
+            result = assessor.assess_risk(*scenario, now=NOW)
+            for key, value in result['risk_components'].items():
+                assert scores[key][i] == pytest.approx(value, abs=1e-3)
+            assert scores['total_risk'][i] == pytest.approx(result['total_risk'], abs=1e-3)
+    
+    def test_batch_from_frame_matches_single(self, assessor):
+        """Test assess_risk_batch over a DataFrame matches per-vehicle assess_risk"""
+        scores = assessor.assess_risk_batch(scenario_frame(), now=NOW)
+        
+        for i, scenario in enumerate(SCENARIOS):
+            result = assessor.assess_risk(*scenario, now=NOW)
+            for key, value in result['risk_components'].items():
+                assert scores[key][i] == pytest.approx(value, abs=1e-3)
+            assert scores['total_risk'][i] == pytest.approx(result['total_risk'], abs=1e-3)
+    
+    def test_result_is_a_json_serializable_dict(self, assessor):
+        """Test assess_risk returns a dict that formats its summary when serialized"""
+        result = assessor.assess_risk(*SCENARIOS[0], now=NOW)
+        
+        assert isinstance(result, dict)
+        assert result['risk_level'] == 'HIGH'
+        
+        loaded = json.loads(json.dumps(result))
+        assert loaded['assessment_summary'] == result['assessment_summary']
+        assert loaded['total_risk'] == result['total_risk']
+    
+    def test_quantized_inputs_match_exact(self, assessor):
+        """Test quantize_inputs gives the exact scores for on-bucket readings"""
+        quantized = RadarRiskAssessor(quantize_inputs=True)
+        
+        for scenario in SCENARIOS:
+            # Twice, so the second call is served from the bucket cache
+            for _ in range(2):
+                assert_same_scores(quantized.assess_risk(*scenario, now=NOW),
+                                   assessor.assess_risk(*scenario, now=NOW))
+    
+    def test_report_stream_matches_generate_report(self, assessor):
+        """Test each NDJSON line of generate_report_stream equals generate_report"""
+        pairs = [(f"scenario_{i}", assessor.assess_risk(*scenario, now=NOW))
+                 for i, scenario in enumerate(SCENARIOS)]
+        
+        lines = list(assessor.generate_report_stream(pairs, now=NOW))
+        
+        assert len(lines) == len(pairs)
+        for line, (scenario_id, result) in zip(lines, pairs):
+            assert line.endswith(b"\n")
+            expected = assessor.generate_report(result, scenario_id=scenario_id, now=NOW)
+            assert json.loads(line) == json.loads(json.dumps(expected))
+    
+    def test_compile_defaults_match_assess_risk(self, assessor):
+        """Test compile() with the module defaults scores like the default assessor"""
+        compiled = RadarRiskAssessor.compile({
+            'TEMP_DANGER': 40.0, 'TEMP_WARNING': 26.0, 'TIME_CRITICAL': 30, 'TIME_WARNING': 10,
+            'CHILD_HR_MIN': 80, 'CHILD_HR_MAX': 120,
+            'weights': (0.25, 0.20, 0.25, 0.15, 0.15)
+        })
+        
+        for scenario in SCENARIOS:
+            result = compiled.assess_risk(*scenario, now=NOW)
+            expected = assessor.assess_risk(*scenario, now=NOW)
+            assert_same_scores(result, expected)
+            assert result['anomalies_detected'] == expected['anomalies_detected']
+    
+    def test_compile_overrides_reach_anomalies_and_batch(self):
+        """Test compile() overrides apply to anomaly detection and the batch path too"""
+        compiled = RadarRiskAssessor.compile({
+            'CHILD_HR_MIN': 70, 'weights': (0.20, 0.20, 0.30, 0.15, 0.15)
+        })
+        radar = {'vital_signs': {'vital_signs_detected': True, 'heart_rate_bpm': 78,
+                                 'breathing_rate_bpm': 25, 'heartbeat_confidence': 0.8,
+                                 'breathing_confidence': 0.8}}
+        scenario = (radar, *SCENARIOS[0][1:])
+        
+        result = compiled.assess_risk(*scenario, now=NOW)
+        heart_rate_anomalies = [a for a in result['anomalies_detected']
+                                if a['type'] == 'abnormal_heart_rate']
+        assert [a['expected_range'] for a in heart_rate_anomalies] == ["70-120 BPM"]
+        
+        batch = RiskInputsBatch.from_inputs([RiskInputs.from_dicts(*scenario)])
+        scores = compiled.assess_risk_batch(batch, now=NOW)
+        for key, value in result['risk_components'].items():
+            assert scores[key][0] == pytest.approx(value, abs=1e-3)
+        assert scores['total_risk'][0] == pytest.approx(result['total_risk'], abs=1e-3)
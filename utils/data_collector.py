@@ -1,74 +1,123 @@
+import numpy as np
 import pandas as pd
 import requests
-import cv2
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import random
+
+try:
+    # Optional: on-disk response cache for repeat weather requests
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+API_KEY = "API_WEATHER"  # Replace with your actual API key
+
+# Weather changes slowly; serve repeat requests from the local cache for 10 min
+WEATHER_CACHE_TTL = 600  # seconds
+
+# Most weather requests collect_weather_batch keeps in flight at once
+WEATHER_MAX_CONCURRENCY = 8
 
 class DataCollector:
-    def __init__(self):
-        self.raw_data = "data/raw"
+    def __init__(self, raw_data="data/raw"):
+        # Weather CSVs and the request cache live here
+        self.raw_data = raw_data
         os.makedirs(self.raw_data, exist_ok=True)
+        
+        if CachedSession is not None:
+            self.session = CachedSession(
+                os.path.join(self.raw_data, ".weather_cache"), expire_after=WEATHER_CACHE_TTL
+            )
+        else:
+            self.session = requests.Session()
 
     # Collect real data from weather in Japan
-    def collect_weather_data(self, city="Tokyo"):
+    def collect_weather_data(self, city="Tokyo", timestamp=None):
         # Using OpenWeatherMap API (free version)
+        if timestamp is None:
+            timestamp = datetime.now()
        
-        api_key = "API_WEATHER"  # Replace with your actual API key
-        if api_key == "API_WEATHER":
+        if API_KEY == "API_WEATHER":
             print("Warning: Please set your OpenWeatherMap API key in data_collector.py")
             print("Get a free API key from: https://openweathermap.org/api")
-            return self.generate_mock_weather_data(city)
-        
-        url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
+            return self.generate_mock_weather_data(city, timestamp=timestamp)
 
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(self._weather_url(city), timeout=10)
             if response.status_code == 200:
-                data = response.json()
-                
                 # Save as a CSV file
-                df = pd.DataFrame([{
-                    "city": city,
-                    "timestamp": datetime.now(),
-                    "temperature_c": data["main"]["temp"],
-                    "humidity": data["main"]["humidity"],
-                    "pressure": data["main"]["pressure"],
-                    "weather": data["weather"][0]["description"],
-                    "wind_speed": data["wind"]["speed"],
-                    "source": "OpenWeatherMap"
-                }])
+                df = self._weather_frame(city, response.json(), timestamp)
                 
-                file_path = os.path.join(self.raw_data, f"weather_{city}.csv")
-                df.to_csv(file_path, index=False)
+                # A cached response was already written on the original miss
+                if not getattr(response, "from_cache", False):
+                    self._append_weather_csv(df, city)
                 print(f"Weather data for {city} collected successfully.")
                 return df
             else:
                 print(f"Failed to get weather data. Status code: {response.status_code}")
-                return self.generate_mock_weather_data(city)
+                return self.generate_mock_weather_data(city, timestamp=timestamp)
                 
         except Exception as e:
             print(f"Error collecting weather data: {e}")
-            return self.generate_mock_weather_data(city)
+            return self.generate_mock_weather_data(city, timestamp=timestamp)
+    
+    def collect_weather_batch(self, cities):
+        """
+        Collect weather for several cities, stamped with one shared timestamp
+        
+        The requests run on threads sharing the cached session, so N cities
+        cost about one round trip instead of N.
+        """
+        timestamp = np.datetime64(datetime.now())
+        if API_KEY == "API_WEATHER" or len(cities) < 2:
+            frames = [self.collect_weather_data(city, timestamp) for city in cities]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(cities), WEATHER_MAX_CONCURRENCY)) as executor:
+                frames = list(executor.map(lambda city: self.collect_weather_data(city, timestamp), cities))
+        return pd.concat(frames, ignore_index=True)
     
-    def generate_mock_weather_data(self, city="Tokyo"):
-        """Generate mock weather data when API is not available"""
+    def generate_mock_weather_data(self, city="Tokyo", n=1, timestamp=None):
+        """Generate n rows of mock weather data when API is not available"""
         print(f"Generating mock weather data for {city}")
         
-        df = pd.DataFrame([{
-            "city": city,
-            "timestamp": datetime.now(),
-            "temperature_c": random.uniform(15, 30),
-            "humidity": random.uniform(40, 80),
-            "pressure": random.uniform(1000, 1020),
-            "weather": random.choice(["clear", "cloudy", "rainy", "sunny"]),
-            "wind_speed": random.uniform(0, 10),
+        rng = np.random.default_rng()
+        df = pd.DataFrame({
+            "city": np.full(n, city),
+            "timestamp": pd.Timestamp(datetime.now() if timestamp is None else timestamp),
+            "temperature_c": rng.uniform(15, 30, n),
+            "humidity": rng.uniform(40, 80, n),
+            "pressure": rng.uniform(1000, 1020, n),
+            "weather": rng.choice(["clear", "cloudy", "rainy", "sunny"], n),
+            "wind_speed": rng.uniform(0, 10, n),
             "source": "MockData"
-        }])
+        })
         
-        file_path = os.path.join(self.raw_data, f"weather_{city}.csv")
-        df.to_csv(file_path, index=False)
+        self._append_weather_csv(df, city)
         return df
+    
+    @staticmethod
+    def _weather_url(city):
+        return f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={API_KEY}&units=metric"
+    
+    @staticmethod
+    def _weather_frame(city, data, timestamp):
+        """One-row frame from an OpenWeatherMap current-weather response"""
+        return pd.DataFrame([{
+            "city": city,
+            "timestamp": timestamp,
+            "temperature_c": data["main"]["temp"],
+            "humidity": data["main"]["humidity"],
+            "pressure": data["main"]["pressure"],
+            "weather": data["weather"][0]["description"],
+            "wind_speed": data["wind"]["speed"],
+            "source": "OpenWeatherMap"
+        }])
+    
+    def _append_weather_csv(self, df, city):
+        """Append readings to the city's CSV history (header only for a new file)"""
+        file_path = os.path.join(self.raw_data, f"weather_{city}.csv")
+        df.to_csv(file_path, mode="a", header=not os.path.exists(file_path), index=False)
 
 if __name__ == "__main__":
     collector = DataCollector()
@@ -0,0 +1,178 @@
+import numpy as np
+from numba import njit
+
+# Compiled helpers for quick signal checks on raw mmWave I/Q captures
+
+
+@njit(cache=True, fastmath=True)
+def magnitude_peaks(iq, distance=1):
+    """
+    Amplitude of a complex I/Q buffer and its peaks above mean + std
+
+    Equivalent to np.abs(iq) followed by
+    scipy.signal.find_peaks(amplitude, height=mean + std, distance=distance),
+    but the magnitude and the threshold statistics come out of one sweep over
+    the buffer and the peak scan is a second sweep over the amplitude.
+    `distance` (samples) drops the lower of any two peaks closer than that,
+    e.g. fs * 60 / max_bpm to cap the detectable rate.
+
+    Returns:
+        (amplitude, peak indices)
+    """
+    n = iq.shape[0]
+    amplitude = np.empty(n)
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        re = iq[i].real
+        im = iq[i].imag
+        sq = re * re + im * im
+        amplitude[i] = np.sqrt(sq)
+        total += amplitude[i]
+        total_sq += sq
+
+    if n == 0:
+        return amplitude, np.empty(0, np.int64)
+
+    mean = total / n
+    threshold = mean + np.sqrt(max(total_sq / n - mean * mean, 0.0))
+
+    peaks = _local_maxima(amplitude, threshold)
+    if distance > 1 and peaks.shape[0] > 1:
+        peaks = _select_by_distance(amplitude, peaks, distance)
+
+    return amplitude, peaks
+
+
+@njit(cache=True)
+def magnitude_stats(iq):
+    """
+    Mean and (population) standard deviation of np.abs(iq), in one sweep
+    without materialising the amplitude array
+
+    Returns:
+        (mean, std)
+    """
+    n = iq.shape[0]
+    if n == 0:
+        return np.nan, np.nan
+    total = 0.0
+    total_sq = 0.0
+    for i in range(n):
+        re = np.float64(iq[i].real)
+        im = np.float64(iq[i].imag)
+        sq = re * re + im * im
+        total += np.sqrt(sq)
+        total_sq += sq
+    mean = total / n
+    return mean, np.sqrt(max(total_sq / n - mean * mean, 0.0))
+
+
+@njit(cache=True)
+def magnitude_bandpass(iq, sos_a, sos_b):
+    """
+    np.abs(iq) run through two SOS filter cascades in a single sweep
+
+    Equivalent to scipy.signal.sosfilt(sos_a, np.abs(iq)) and
+    sosfilt(sos_b, np.abs(iq)) (zero initial state, a0 == 1 as butter
+    designs them), but each sample's magnitude feeds both cascades
+    directly instead of materialising the amplitude array first.
+
+    Returns:
+        (filtered by sos_a, filtered by sos_b)
+    """
+    zi_a = np.zeros((sos_a.shape[0], 2))
+    zi_b = np.zeros((sos_b.shape[0], 2))
+    return magnitude_bandpass_stream(iq, sos_a, sos_b, zi_a, zi_b)
+
+
+@njit(cache=True)
+def magnitude_bandpass_stream(iq, sos_a, sos_b, zi_a, zi_b):
+    """
+    magnitude_bandpass for one chunk of a continuous capture
+
+    zi_a / zi_b are the cascades' (n_sections, 2) filter states: they are
+    read as the state left by the previous chunk and updated in place, so
+    filtering consecutive chunks gives the same output as one call over the
+    whole capture. Start from zeros to match magnitude_bandpass.
+    """
+    n = iq.shape[0]
+    out_a = np.empty(n)
+    out_b = np.empty(n)
+    for i in range(n):
+        re = iq[i].real
+        im = iq[i].imag
+        x = np.sqrt(re * re + im * im)
+        out_a[i] = _biquad_cascade_step(sos_a, zi_a, x)
+        out_b[i] = _biquad_cascade_step(sos_b, zi_b, x)
+    return out_a, out_b
+
+
+@njit(cache=True, inline='always')
+def _biquad_cascade_step(sos, zi, x):
+    """One sample through a cascade of transposed direct-form II biquads, as sosfilt does"""
+    for s in range(sos.shape[0]):
+        y = sos[s, 0] * x + zi[s, 0]
+        zi[s, 0] = sos[s, 1] * x - sos[s, 4] * y + zi[s, 1]
+        zi[s, 1] = sos[s, 2] * x - sos[s, 5] * y
+        x = y
+    return x
+
+
+@njit(cache=True)
+def count_peaks(x, distance=1):
+    """
+    Number of peaks scipy.signal.find_peaks(x, distance=distance) finds
+
+    For callers that only need the count: no peak array or properties
+    dict is handed back. Pass math.ceil(distance) for a fractional
+    distance, as find_peaks rounds it up.
+    """
+    peaks = _local_maxima(x, -np.inf)
+    if distance > 1 and peaks.shape[0] > 1:
+        peaks = _select_by_distance(x, peaks, distance)
+    return peaks.shape[0]
+
+
+@njit(cache=True)
+def _local_maxima(x, threshold):
+    """Local maxima at or above threshold; a flat top counts once, at its middle sample"""
+    n = x.shape[0]
+    peaks = np.empty(n // 2 + 1, np.int64)
+    count = 0
+    i = 1
+    i_max = n - 1
+    while i < i_max:
+        if x[i - 1] < x[i]:
+            i_ahead = i + 1
+            while i_ahead < i_max and x[i_ahead] == x[i]:
+                i_ahead += 1
+            if x[i_ahead] < x[i]:
+                peak = (i + i_ahead - 1) // 2
+                if x[peak] >= threshold:
+                    peaks[count] = peak
+                    count += 1
+                i = i_ahead
+        i += 1
+    return peaks[:count]
+
+
+@njit(cache=True)
+def _select_by_distance(amplitude, peaks, distance):
+    """find_peaks' distance rule: keep the highest peaks, drop their close neighbours"""
+    n = peaks.shape[0]
+    keep = np.ones(n, np.bool_)
+    order = np.argsort(amplitude[peaks])
+    for i in range(n - 1, -1, -1):
+        j = order[i]
+        if not keep[j]:
+            continue
+        k = j - 1
+        while k >= 0 and peaks[j] - peaks[k] < distance:
+            keep[k] = False
+            k -= 1
+        k = j + 1
+        while k < n and peaks[k] - peaks[j] < distance:
+            keep[k] = False
+            k += 1
+    return peaks[keep]
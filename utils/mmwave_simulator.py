@@ -2,18 +2,41 @@ import numpy as np
 import pandas as pd
 import scipy.signal as signal
 from datetime import datetime, timedelta
-import json
+import orjson
+import math
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from utils.fast_signal import count_peaks, magnitude_bandpass, magnitude_bandpass_stream, magnitude_stats
+
+# 4th-order Butterworth bandpass as SOS; one design per (fs, band), shared by
+# every simulator instance (read-only, since callers share the array)
+@lru_cache(maxsize=8)
+def _design_bandpass(fs, low, high):
+    sos = signal.butter(4, [low, high], btype='band', fs=fs, output='sos')
+    sos.flags.writeable = False
+    return sos
+
+# Worker for generate_scenario_dataset: task is (sampling_rate, duration, index, seed)
+def _generate_scenario_task(task):
+    sampling_rate, duration, i, seed = task
+    return MMWaveSimulator(sampling_rate, duration, seed).generate_scenario(i)
 
 # Simulate mmWave radar based vital signal detection
 # Based on real mmWave radar principles (FMCW radar)
 class MMWaveSimulator:
 
-    def __init__(self, sampling_rate=100, duration=60):
+    def __init__(self, sampling_rate=100, duration=60, seed=None):
         
         self.fs = sampling_rate  # Sampling rate in Hz
         self.duration = duration  # Duration in seconds
         self.times = np.arange(0, duration, 1/sampling_rate)
+        self.num_samples = len(self.times)
+
+        # Every random draw goes through this generator (pass seed to reproduce a run)
+        self.rng = np.random.default_rng(seed)
+        # Scratch for the complex noise: (I, Q) pairs refilled on every capture
+        self._noise_buffer = np.empty((self.num_samples, 2))
         
         # Vital sign parameters
         self.adult_heart_rate = 60-100 # bpm
@@ -32,15 +55,26 @@ class MMWaveSimulator:
         self.car_temp_range = (0, 75)  # Celsius
         self.seat_pressure_adult = (0, 200) # kg
 
+        # Vital-sign bandpass filters, designed once per sampling rate
+        # Breathing: 0.1-0.5 Hz (6-30 breaths/min), heartbeat: 0.8-3.0 Hz (48-180 BPM)
+        self.breathing_sos = _design_bandpass(self.fs, 0.1, 0.5)
+        self.heartbeat_sos = _design_bandpass(self.fs, 0.8, 3.0)
+
+        # Phase grid 2*pi*t shared by every sine below, and the fixed car seat
+        # vibration (read-only: captures are built on top of it, never in it)
+        self._two_pi_t = 2 * np.pi * self.times
+        self._base_signal = 0.5 * np.sin(self.car_seat_vibration_frequency * self._two_pi_t)
+        self._base_signal.flags.writeable = False
+
        # Generate simulated I/Q data from mmWave radar
        # I/Q = In-phase and Quadrature components
        # Returns simulated I/Q data for realistic vital signs and car environment
     
-    def generate_mmwave_iq_data(self, has_child=True, movement_level='low'):
+    def generate_mmwave_iq_data(self, has_child=True, movement_level='low', dtype=np.complex128):
         # Base signal (car interior reflections)
+        # dtype=np.complex64 halves the buffer for bandwidth-bound processing
 
-        num_samples = len(self.times)
-        base_signal = 0.5 * np.sin(2 * np.pi * self.car_seat_vibration_frequency * self.times)
+        base_signal = self._base_signal
 
         if has_child:
             # Child vital signs
@@ -49,14 +83,16 @@ class MMWaveSimulator:
 
         else:
             # Empty car - only base signal
+            child_signal = None
             radar_signal = base_signal
 
-        # Add micro-movements (breathing, heartbeat)
-        radar_signal = self._add_micro_movements(radar_signal, has_child, movement_level)
+        # Add micro-movements (breathing, heartbeat), reusing the same vitals
+        radar_signal = self._add_micro_movements(radar_signal, has_child, movement_level, child_signal)
         # Add random noise (realistic SNR)
-        radar_signal = radar_signal.astype(np.complex128)
-        noise = np.random.normal(0, 0.05, num_samples) + 1j * np.random.normal(0, 0.05, num_samples)
-        radar_signal += noise
+        radar_signal = radar_signal.astype(dtype)
+        noise = self.rng.standard_normal(out=self._noise_buffer)
+        noise *= 0.05
+        radar_signal += noise.view(np.complex128)[:, 0]
             
         return radar_signal
     
@@ -64,94 +100,118 @@ class MMWaveSimulator:
     # Generate realistic child vital sign patterns
     def _generate_child_vital_signs(self):
 
-        num_samples = len(self.times)
-
         # Child breating: 0.3-0.5 Hz (18-30 breaths/min)
-        breating_freq = np.random.uniform(0.3, 0.5)
-        breathing_signal = 0.02 * np.sin(2 * np.pi * breating_freq * self.times + np.random.uniform(0, 2*np.pi))
+        breating_freq = self.rng.uniform(0.3, 0.5)
+        breathing_signal = 0.02 * np.sin(breating_freq * self._two_pi_t + self.rng.uniform(0, 2*np.pi))
 
         # Child heartbeat: 1.3-2.0 Hz (78-120 BPM)
-        heart_freq = np.random.uniform(1.3, 2.0)
-        heart_signal = 0.3 * np.sin(2 * np.pi * heart_freq * self.times)
+        heart_freq = self.rng.uniform(1.3, 2.0)
+        heart_signal = 0.3 * np.sin(heart_freq * self._two_pi_t)
 
         # Harmonic components (realistic for radar)
-        harmonics = 0.1 * np.sin(2 * np.pi * 2 * heart_freq * self.times)
+        harmonics = 0.1 * np.sin(2 * heart_freq * self._two_pi_t)
 
         return breathing_signal + heart_signal + harmonics
     
     # Add realistic micro-movements based on child activity level in car
-    def _add_micro_movements(self, signal, has_child, movement_level):
+    # vitals: the child's vital-sign signal if the caller already generated it
+    def _add_micro_movements(self, signal, has_child, movement_level, vitals=None):
 
-        num_samples = len(self.times)
-        micro_movement_signal = np.zeros(num_samples)
+        num_samples = self.num_samples
 
         if has_child:
             # Child breathing and heartbeat
-            micro_movement_signal += self._generate_child_vital_signs()
+            if vitals is None:
+                vitals = self._generate_child_vital_signs()
+            micro_movement_signal = vitals.copy()
 
             # Add movement based on activity level
             if movement_level == 'sleeping':
                 # Minimal movement, only breathing
-                micro_movement_signal += 0.005 * np.random.normal(0, 1, num_samples)
+                micro_movement_signal += 0.005 * self.rng.normal(0, 1, num_samples)
                 
             elif movement_level == 'low':
                 # Quiet activity - fidgeting, slight shifts
-                micro_movement_signal += 0.015 * np.random.normal(0, 1, num_samples)
+                micro_movement_signal += 0.015 * self.rng.normal(0, 1, num_samples)
                 # Occasional small position shifts every 5-10 seconds
-                for i in range(0, num_samples, np.random.randint(500, 1000)):
-                    micro_movement_signal[i:min(i+50, num_samples)] += 0.02 * np.sin(2 * np.pi * 0.5 * self.times[:min(50, num_samples-i)])
+                self._add_movement_bursts(micro_movement_signal, self.rng.integers(500, 1000), 50, 0.02, 0.5)
                     
             elif movement_level == 'medium':
                 # Active - squirming, seat adjustments
-                micro_movement_signal += 0.04 * np.random.normal(0, 1, num_samples)
+                micro_movement_signal += 0.04 * self.rng.normal(0, 1, num_samples)
                 # Regular movement bursts every 3-5 seconds
-                for i in range(0, num_samples, np.random.randint(300, 500)):
-                    micro_movement_signal[i:min(i+100, num_samples)] += 0.06 * np.sin(2 * np.pi * 1.5 * self.times[:min(100, num_samples-i)])
+                self._add_movement_bursts(micro_movement_signal, self.rng.integers(300, 500), 100, 0.06, 1.5)
                     
             elif movement_level == 'high':
                 # Very active - kicking, twisting, restless
-                micro_movement_signal += 0.08 * np.random.normal(0, 1, num_samples)
+                micro_movement_signal += 0.08 * self.rng.normal(0, 1, num_samples)
                 # Frequent large movements
-                for i in range(0, num_samples, np.random.randint(100, 300)):
-                    micro_movement_signal[i:min(i+150, num_samples)] += 0.1 * np.sin(2 * np.pi * 2.5 * self.times[:min(150, num_samples-i)])
+                self._add_movement_bursts(micro_movement_signal, self.rng.integers(100, 300), 150, 0.1, 2.5)
+
+        else:
+            micro_movement_signal = np.zeros(num_samples)
 
         return signal + micro_movement_signal
     
+    # Add a sine burst of burst_len samples at every step-th sample, in place
+    def _add_movement_bursts(self, out, step, burst_len, amplitude, frequency):
+
+        num_samples = len(out)
+        burst = amplitude * np.sin(frequency * self._two_pi_t[:burst_len])
+
+        # One index per burst sample; bursts may overlap when step < burst_len
+        # and the last one is cut off at the end of the signal
+        idx = np.arange(0, num_samples, step)[:, None] + np.arange(len(burst))
+        in_range = idx < num_samples
+        out += np.bincount(idx[in_range], np.broadcast_to(burst, idx.shape)[in_range], num_samples)
+    
     def extract_vital_signs(self, iq_data):
         """
         Process I/Q data to extract vital signs using signal processing
         This mimics real mmWave radar processing pipeline
         """
-        # Convert to amplitude (real signal)
-        amplitude = np.abs(iq_data)
-        
-        # Apply bandpass filters for vital signs
-        # Breathing: 0.1-0.5 Hz (6-30 breaths/min)
-        breathing_filter = signal.butter(4, [0.1, 0.5], btype='band', fs=self.fs, output='sos')
-        breathing_signal = signal.sosfilt(breathing_filter, amplitude)
-        
-        # Heartbeat: 0.8-3.0 Hz (48-180 BPM)
-        heartbeat_filter = signal.butter(4, [0.8, 3.0], btype='band', fs=self.fs, output='sos')
-        heartbeat_signal = signal.sosfilt(heartbeat_filter, amplitude)
+        # Convert to amplitude (real signal) and apply the bandpass filters
+        # for vital signs, all in one pass over the samples
+        breathing_signal, heartbeat_signal = magnitude_bandpass(
+            iq_data, self.breathing_sos, self.heartbeat_sos
+        )
         
         # Calculate vital signs from filtered signals
         vital_signs = self._analyze_vital_signs(breathing_signal, heartbeat_signal)
         
         return vital_signs
     
+    def filter_vital_signs_chunk(self, iq_chunk, state=None):
+        """
+        Bandpass one chunk of a continuous I/Q stream
+        state is what the previous call returned (None to start a stream);
+        chaining calls over consecutive chunks gives exactly the signals
+        extract_vital_signs filters from the whole capture, so overlapping
+        analysis windows never need re-filtering
+        
+        Returns:
+            (breathing signal, heartbeat signal, state for the next chunk)
+        """
+        if state is None:
+            state = (np.zeros((len(self.breathing_sos), 2)), np.zeros((len(self.heartbeat_sos), 2)))
+        breathing_signal, heartbeat_signal = magnitude_bandpass_stream(
+            iq_chunk, self.breathing_sos, self.heartbeat_sos, *state
+        )
+        return breathing_signal, heartbeat_signal, state
+    
     def _analyze_vital_signs(self, breathing_signal, heartbeat_signal):
         """Extract BPM from filtered signals"""
-        # Find peaks in breathing signal
-        breathing_peaks, _ = signal.find_peaks(breathing_signal, distance=self.fs*0.8)  # Min 0.8s between breaths
-        breathing_bpm = len(breathing_peaks) / (self.duration / 60) if len(breathing_peaks) > 1 else 0
+        # Count peaks in breathing signal
+        breathing_peaks = count_peaks(breathing_signal, math.ceil(self.fs*0.8))  # Min 0.8s between breaths
+        breathing_bpm = breathing_peaks / (self.duration / 60) if breathing_peaks > 1 else 0
         
-        # Find peaks in heartbeat signal
-        heartbeat_peaks, _ = signal.find_peaks(heartbeat_signal, distance=self.fs*0.3)  # Min 0.3s between beats
-        heartbeat_bpm = len(heartbeat_peaks) / (self.duration / 60) if len(heartbeat_peaks) > 1 else 0
+        # Count peaks in heartbeat signal
+        heartbeat_peaks = count_peaks(heartbeat_signal, math.ceil(self.fs*0.3))  # Min 0.3s between beats
+        heartbeat_bpm = heartbeat_peaks / (self.duration / 60) if heartbeat_peaks > 1 else 0
         
         # Calculate signal quality metrics
-        breathing_confidence = min(len(breathing_peaks) * 0.2, 1.0)
-        heartbeat_confidence = min(len(heartbeat_peaks) * 0.1, 1.0)
+        breathing_confidence = min(breathing_peaks * 0.2, 1.0)
+        heartbeat_confidence = min(heartbeat_peaks * 0.1, 1.0)
         
         return {
             'breathing_rate_bpm': round(breathing_bpm, 1),
@@ -161,70 +221,83 @@ class MMWaveSimulator:
             'vital_signs_detected': breathing_bpm > 5 or heartbeat_bpm > 40
         }
     
-    def generate_scenario_dataset(self, num_scenarios=50):
-        """Generate multiple scenarios for training/validation"""
-        scenarios = []
+    def generate_scenario_dataset(self, num_scenarios=50, max_workers=1):
+        """
+        Generate multiple scenarios for training/validation
+        Each scenario gets its own seed from self.rng, so a seeded run is reproducible
+        whatever the worker count. A scenario takes about 1 ms, less than starting a
+        process pool, so they are generated in this process unless max_workers asks
+        for worker processes (None = one per core)
+        """
+        seeds = self.rng.integers(0, 2**63, num_scenarios)
+        tasks = [(self.fs, self.duration, i, seed) for i, seed in enumerate(seeds)]
         
-        for i in range(num_scenarios):
-            # Randomly determine scenario
-            has_child = np.random.random() > 0.3  # 70% have children
-            movement_level = np.random.choice(['low', 'medium', 'high'], p=[0.5, 0.3, 0.2])
-            
-            # Generate radar data
-            iq_data = self.generate_mmwave_iq_data(has_child, movement_level)
-            
-            # Extract vital signs
-            vital_signs = self.extract_vital_signs(iq_data)
-            
-            # Add car sensor data
-            car_data = self.generate_car_sensor_data(has_child)
-            
-            scenario = {
-                'scenario_id': f'scenario_{i:03d}',
-                'timestamp': datetime.now().isoformat(),
-                'has_child': has_child,
-                'movement_level': movement_level,
-                'vital_signs': vital_signs,
-                'car_sensors': car_data,
-                'radar_metadata': {
-                    'sampling_rate': self.fs,
-                    'duration': self.duration,
-                    'samples': len(iq_data),
-                    'iq_mean': np.mean(np.abs(iq_data)),
-                    'iq_std': np.std(np.abs(iq_data))
-                }
+        if num_scenarios > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_generate_scenario_task, tasks))
+        return [_generate_scenario_task(task) for task in tasks]
+    
+    def generate_scenario(self, i):
+        """Generate scenario number i (the first 5 also save their raw I/Q)"""
+        # Randomly determine scenario
+        has_child = self.rng.random() > 0.3  # 70% have children
+        movement_level = self.rng.choice(['low', 'medium', 'high'], p=[0.5, 0.3, 0.2])
+        
+        # Generate radar data; single precision is plenty for the extracted
+        # vital signs and halves the I/Q buffer
+        iq_data = self.generate_mmwave_iq_data(has_child, movement_level, dtype=np.complex64)
+        iq_mean, iq_std = magnitude_stats(iq_data)
+        
+        # Extract vital signs
+        vital_signs = self.extract_vital_signs(iq_data)
+        
+        # Add car sensor data
+        car_data = self.generate_car_sensor_data(has_child)
+        
+        scenario = {
+            'scenario_id': f'scenario_{i:03d}',
+            'timestamp': datetime.now().isoformat(),
+            'has_child': has_child,
+            'movement_level': movement_level,
+            'vital_signs': vital_signs,
+            'car_sensors': car_data,
+            'radar_metadata': {
+                'sampling_rate': self.fs,
+                'duration': self.duration,
+                'samples': len(iq_data),
+                'iq_mean': iq_mean,
+                'iq_std': iq_std
             }
-            
-            scenarios.append(scenario)
-            
-            # Save raw I/Q data (first 1000 samples for demonstration)
-            if i < 5:  # Save only first 5 for demo
-                raw_data = {
-                    'iq_real': np.real(iq_data)[:1000].tolist(),
-                    'iq_imag': np.imag(iq_data)[:1000].tolist(),
-                    'time': self.times[:1000].tolist()
-                }
-                
-                os.makedirs('data/raw/mmwave', exist_ok=True)
-                with open(f'data/raw/mmwave/scenario_{i:03d}_iq.json', 'w') as f:
-                    json.dump(raw_data, f, indent=2)
+        }
         
-        return scenarios
+        # Save raw I/Q data (first 1000 samples for demonstration) as
+        # float32 arrays in an .npz rather than JSON lists
+        if i < 5:  # Save only first 5 for demo
+            os.makedirs('data/raw/mmwave', exist_ok=True)
+            head = iq_data[:1000]  # complex64 already, so .real/.imag need no cast
+            np.savez(
+                f'data/raw/mmwave/scenario_{i:03d}_iq.npz',
+                iq_real=head.real.astype(np.float32, copy=False),
+                iq_imag=head.imag.astype(np.float32, copy=False),
+                time=self.times[:1000].astype(np.float32)
+            )
+        
+        return scenario
     
     def generate_car_sensor_data(self, has_child):
         """Generate realistic car sensor data"""
         # Seat pressure sensors
         if has_child:
-            seat_pressure = np.random.uniform(8, 25)  # Child weight 8-25 kg
+            seat_pressure = self.rng.uniform(8, 25)  # Child weight 8-25 kg
         else:
-            seat_pressure = np.random.uniform(0, 2)  # Empty or light object
+            seat_pressure = self.rng.uniform(0, 2)  # Empty or light object
         
         # Temperature simulation (car heats up when closed)
-        base_temp = np.random.uniform(15, 25)
-        car_closed = np.random.random() > 0.5
+        base_temp = self.rng.uniform(15, 25)
+        car_closed = self.rng.random() > 0.5
         if car_closed:
             # Car heats up 10-20°C over time
-            temp_increase = np.random.uniform(10, 20)
+            temp_increase = self.rng.uniform(10, 20)
             current_temp = base_temp + temp_increase
         else:
             current_temp = base_temp
@@ -236,10 +309,10 @@ class MMWaveSimulator:
         return {
             'seat_pressure_kg': round(seat_pressure, 1),
             'temperature_c': round(current_temp, 1),
-            'door_state': np.random.choice(door_states, p=[0.2, 0.8]),
-            'engine_state': np.random.choice(engine_states, p=[0.3, 0.7]),
-            'co2_ppm': np.random.uniform(400, 1500),
-            'humidity_percent': np.random.uniform(30, 80)
+            'door_state': self.rng.choice(door_states, p=[0.2, 0.8]),
+            'engine_state': self.rng.choice(engine_states, p=[0.3, 0.7]),
+            'co2_ppm': self.rng.uniform(400, 1500),
+            'humidity_percent': self.rng.uniform(30, 80)
         }
     
     def save_dataset(self, scenarios, filename='mmwave_dataset.json'):
@@ -257,8 +330,11 @@ class MMWaveSimulator:
             'scenarios': scenarios
         }
         
-        with open(f'data/processed/{filename}', 'w') as f:
-            json.dump(dataset, f, indent=2, default=str)
+        # orjson handles NumPy scalars natively; anything else falls back to str
+        with open(f'data/processed/{filename}', 'wb') as f:
+            f.write(orjson.dumps(
+                dataset, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+            ))
         
         print(f"Dataset saved: {len(scenarios)} scenarios")
         return dataset
@@ -268,17 +344,29 @@ class EnvironmentalDataCollector:
     """Collect real environmental data for context"""
     
     def __init__(self, api_key=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
         self.api_key = api_key or "YOUR_OPENWEATHER_API_KEY"
         self.base_url = "http://api.openweathermap.org/data/2.5"
+        
+        # Keep-alive connection pool shared by every request, with a few
+        # backed-off retries for transient failures
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4, pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def get_current_weather(self, city="Tokyo"):
         """Get real weather data"""
-        import requests
-        
         url = f"{self.base_url}/weather?q={city}&appid={self.api_key}&units=metric"
         
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 weather_info = {
@@ -299,12 +387,10 @@ class EnvironmentalDataCollector:
     
     def get_forecast(self, city="Tokyo", days=1):
         """Get weather forecast"""
-        import requests
-        
         url = f"{self.base_url}/forecast?q={city}&appid={self.api_key}&units=metric&cnt={days*8}"  # 8 forecasts per day
         
         try:
-            response = requests.get(url, timeout=10)
+            response = self.session.get(url, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 forecasts = []
@@ -355,8 +441,8 @@ if __name__ == "__main__":
         print(f"  Conditions: {weather['weather']}")
         
         # Save weather data
-        with open('data/processed/weather_data.json', 'w') as f:
-            json.dump(weather, f, indent=2)
+        with open('data/processed/weather_data.json', 'wb') as f:
+            f.write(orjson.dumps(weather, option=orjson.OPT_INDENT_2))
     
     print("\nData generation complete!")
     print("Raw data: data/raw/mmwave/")